@@ -4,6 +4,7 @@ NFT_AUCTION_TEST_DIR=$(cd test/NFTAuction && pwd)
 BLUEPRINTS_TEST_DIR=$(cd test/Blueprints && pwd)
 SYSTEM_TEST_DIR=$(cd test/System && pwd)
 SWITCHBOARD_TEST_DIR=$(cd test/Switchboard && pwd)
-FINAL_PATH="$TEST_DIR_PATH:$ASYNC_ARTWORK_TEST_DIR:$NFT_AUCTION_TEST_DIR:$BLUEPRINTS_TEST_DIR:$SYSTEM_TEST_DIR:$SWITCHBOARD_TEST_DIR"
+HARNESS_TEST_DIR=$(cd test/Harness && pwd)
+FINAL_PATH="$TEST_DIR_PATH:$ASYNC_ARTWORK_TEST_DIR:$NFT_AUCTION_TEST_DIR:$BLUEPRINTS_TEST_DIR:$SYSTEM_TEST_DIR:$SWITCHBOARD_TEST_DIR:$HARNESS_TEST_DIR"
 export PYTHONPATH=$FINAL_PATH
 pytest
\ No newline at end of file
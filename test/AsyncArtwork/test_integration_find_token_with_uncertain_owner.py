@@ -1,7 +1,6 @@
 from initialize_testing_environment import main
 from transaction_handler import send_transaction, send_async_artwork_transaction
 from script_handler import send_async_artwork_script_and_return_result
-from event_handler import check_for_event
 from utils import address
 import json
 import pytest
@@ -19,9 +18,10 @@ def mint_master_token(args, signer, should_succeed, expected_master_mint_res, ex
   mint_args = [["UInt64", args[0]], ["String", args[1]], ["Array", control_token_artists], ["Array", unique_artists]]
 
   if should_succeed:
-    assert send_async_artwork_transaction("mintMasterToken", args=mint_args, signer=signer)
+    txn_result = send_async_artwork_transaction("mintMasterToken", args=mint_args, signer=signer)
+    assert txn_result
     event = f'A.{address("AsyncArtwork")[2:]}.AsyncArtwork.Deposit'
-    assert check_for_event(event)
+    assert txn_result.has_event(event)
     assert expected_master_mint_res == send_async_artwork_script_and_return_result("getMasterMintReservation", args=[["Address", address(signer)]])
     metadata = send_async_artwork_script_and_return_result("getMetadata", args=[["UInt64", args[0]]])
     print(metadata)
@@ -1,6 +1,5 @@
 from initialize_testing_environment import main
 from transaction_handler import send_transaction
-from event_handler import check_for_event
 from utils import address, transfer_flow_token
 import json
 import pytest
@@ -0,0 +1,68 @@
+from initialize_testing_environment import main
+from transaction_handler import send_async_artwork_transaction
+from script_handler import ScriptError, send_async_artwork_script_and_return_decoded_result
+import pytest
+
+# Test specific setup functions
+from test_unit_setup_async_resources import setup_async_resources
+from test_unit_whitelist import whitelist
+from test_unit_mint_master_token import mint_master_token
+from test_unit_mint_control_token import mint_control_token
+from test_unit_use_control_token import use_control_token
+
+def get_lever_values(token_id, lever_ids):
+  args = [["UInt64", token_id], ["Array", [["UInt64", lever_id] for lever_id in lever_ids]]]
+  return send_async_artwork_script_and_return_decoded_result("getLeverValues", args=args)
+
+def migrate_lever_storage(token_ids, signer, should_succeed):
+  args = [["Array", [["UInt64", token_id] for token_id in token_ids]]]
+  if should_succeed:
+    assert send_async_artwork_transaction("migrateLeverStorage", args=args, signer=signer)
+    print("Successfully Migrated Lever Storage")
+  else:
+    assert not send_async_artwork_transaction("migrateLeverStorage", args=args, signer=signer)
+    print("Migrating Lever Storage Failed as Expected")
+
+@pytest.mark.core
+def test_get_lever_values():
+  # Deploy contracts
+  main()
+
+  setup_async_resources("User1")
+  setup_async_resources("User2")
+
+  whitelist(["User1", "1", "1", "0.01"], "AsyncArtAccount", True)
+  mint_master_token(["1", "<uri>", ["User2"], []], "User1", True)
+  mint_control_token(["2", "<uri>", ["1", "1", "-5"], ["10", "20", "5"], ["3", "18", "0"], "5", []], "User2", True, "{}")
+
+  # Values come back in the order the ids were requested
+  assert get_lever_values("2", ["0", "1", "2"]) == [3, 18, 0]
+  assert get_lever_values("2", ["2", "0"]) == [0, 3]
+  assert get_lever_values("2", []) == []
+  assert send_async_artwork_script_and_return_decoded_result("getMetadataLeverValue", args=[["UInt64", "2"], ["UInt64", "1"]]) == 18
+
+  # Updates are visible through the range read and the struct view
+  use_control_token(["2", ["0", "2"], ["9", "-5"], "0.0"], "User2", True)
+  assert get_lever_values("2", ["0", "1", "2"]) == [9, 18, -5]
+  levers = send_async_artwork_script_and_return_decoded_result("getMetadataLevers", args=[["UInt64", "2"]])
+  assert {lever_id: (lever.minValue, lever.maxValue, lever.currentValue) for lever_id, lever in levers.items()} == {0: (1, 10, 9), 1: (1, 20, 18), 2: (-5, 5, -5)}
+
+  # Check that out of range lever values and lever ids are rejected
+  use_control_token(["2", ["1"], ["21"], "0.0"], "User2", False)
+  use_control_token(["2", ["3"], ["1"], "0.0"], "User2", False)
+  assert get_lever_values("2", ["0", "1", "2"]) == [9, 18, -5]
+
+  # Reading a lever that does not exist fails
+  with pytest.raises(ScriptError):
+    get_lever_values("2", ["3"])
+
+  # Tokens minted into the lever store have nothing to migrate, migrating leaves them untouched
+  migrate_lever_storage(["1", "2"], "AsyncArtAccount", True)
+  assert get_lever_values("2", ["0", "1", "2"]) == [9, 18, -5]
+
+  # Only the admin can migrate, and only existing tokens
+  migrate_lever_storage(["2"], "User2", False)
+  migrate_lever_storage(["3"], "AsyncArtAccount", False)
+
+if __name__ == '__main__':
+  test_get_lever_values()
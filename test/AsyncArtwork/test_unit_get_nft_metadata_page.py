@@ -0,0 +1,53 @@
+from initialize_testing_environment import main
+from script_handler import ScriptError, send_async_artwork_script_and_return_decoded_result, crawl_nft_metadata
+import pytest
+
+# Test specific setup functions
+from test_unit_setup_async_resources import setup_async_resources
+from test_unit_whitelist import whitelist
+
+# expected args: [startId, limit]
+
+def get_nft_metadata_page(args, expected_ids, expected_next_id):
+  page = send_async_artwork_script_and_return_decoded_result("getNFTMetadataPage", args=[["UInt64", args[0]], ["UInt64", args[1]]])
+  assert [item.id for item in page.items] == expected_ids
+  assert page.nextId == expected_next_id
+  return page
+
+@pytest.mark.core
+def test_get_nft_metadata_page():
+  # Deploy contracts
+  main()
+
+  setup_async_resources("User1")
+  setup_async_resources("User2")
+
+  # Nothing whitelisted yet
+  get_nft_metadata_page(["1", "10"], [], None)
+  assert 0 == send_async_artwork_script_and_return_decoded_result("getNFTMetadataCount")
+
+  # Master token 1 with control tokens 2 and 3, master token 4 with control token 5, master token 6
+  whitelist(["User1", "1", "2", "0.01"], "AsyncArtAccount", True)
+  whitelist(["User2", "4", "1", "0.01"], "AsyncArtAccount", True)
+  whitelist(["User1", "6", "0", "0.01"], "AsyncArtAccount", True)
+  assert 6 == send_async_artwork_script_and_return_decoded_result("getNFTMetadataCount")
+
+  page = get_nft_metadata_page(["1", "2"], [1, 2], 3)
+  assert page.maxId == 6
+  assert page.items[0].isMaster and not page.items[1].isMaster
+  get_nft_metadata_page(["3", "2"], [3, 4], 5)
+  get_nft_metadata_page(["5", "2"], [5, 6], None)
+  get_nft_metadata_page(["5", "10"], [5, 6], None)
+  get_nft_metadata_page(["7", "10"], [], None)
+
+  # Zero sized pages are rejected
+  with pytest.raises(ScriptError):
+    send_async_artwork_script_and_return_decoded_result("getNFTMetadataPage", args=[["UInt64", "1"], ["UInt64", "0"]])
+
+  # The crawler returns every token exactly once and in order, whatever the page size
+  for page_size in [1, 2, 4, 100]:
+    assert [item.id for item in crawl_nft_metadata(page_size=page_size, concurrency=3)] == [1, 2, 3, 4, 5, 6]
+  assert [item.id for item in crawl_nft_metadata(page_size=2, start_id=4)] == [4, 5, 6]
+
+if __name__ == '__main__':
+  test_get_nft_metadata_page()
@@ -1,7 +1,6 @@
 from initialize_testing_environment import main
 from transaction_handler import send_async_artwork_transaction
 from script_handler import send_async_artwork_script_and_return_result
-from event_handler import check_for_event
 from utils import address
 import json
 import pytest
@@ -17,9 +16,10 @@ def grant_control_permission(args, signer, should_succeed, expected_control_upda
   grant_args = [["UInt64", args[0]], ["Address", address(args[1])], ["Bool", args[2]]]
 
   if should_succeed:
-    assert send_async_artwork_transaction("grantControlPermission", args=grant_args, signer=signer)
+    txn_result = send_async_artwork_transaction("grantControlPermission", args=grant_args, signer=signer)
+    assert txn_result
     event = f'A.{address("AsyncArtwork")[2:]}.AsyncArtwork.PermissionUpdated'
-    assert check_for_event(event)
+    assert txn_result.has_event(event)
     assert expected_control_update == send_async_artwork_script_and_return_result("getControlUpdate", args=[["Address", address(args[1])]])
     print("Successfuly Updated Control Permission for User")
   else:
@@ -1,7 +1,6 @@
 from initialize_testing_environment import main
 from transaction_handler import send_async_artwork_transaction
 from script_handler import send_async_artwork_script_and_return_result
-from event_handler import check_for_event
 from metadata_handler import result_equals_expected_metadata
 from utils import address
 import json
@@ -30,9 +29,10 @@ def mint_control_token(args, signer, should_succeed, expected_control_mint_reser
   ]
 
   if should_succeed:
-    assert send_async_artwork_transaction("mintControlToken", args=mint_args, signer=signer)
+    txn_result = send_async_artwork_transaction("mintControlToken", args=mint_args, signer=signer)
+    assert txn_result
     event = f'A.{address("AsyncArtwork")[2:]}.AsyncArtwork.Deposit'
-    assert check_for_event(event)
+    assert txn_result.has_event(event)
     assert expected_control_mint_reservation == send_async_artwork_script_and_return_result("getControlMintReservation", args=[["Address", address(signer)]])
     metadata = send_async_artwork_script_and_return_result("getMetadata", args=[["UInt64", args[0]]])
     print(metadata)
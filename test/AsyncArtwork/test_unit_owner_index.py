@@ -0,0 +1,60 @@
+from initialize_testing_environment import main
+from transaction_handler import send_async_artwork_transaction
+from script_handler import send_async_artwork_script_and_return_decoded_result
+from utils import address
+import pytest
+
+# Test specific setup functions
+from test_unit_setup_async_resources import setup_async_resources
+from test_unit_whitelist import whitelist
+from test_unit_mint_master_token import mint_master_token
+from test_unit_mint_control_token import mint_control_token
+from test_unit_transfer_nft import transfer_nft
+
+def assert_owner_index(user, expected_ids):
+  ids = send_async_artwork_script_and_return_decoded_result("getTokenIdsByOwner", args=[["Address", address(user)]])
+  assert sorted(ids) == expected_ids
+  assert len(expected_ids) == send_async_artwork_script_and_return_decoded_result("getTokenCountByOwner", args=[["Address", address(user)]])
+  # The index agrees with the collection itself
+  assert sorted(send_async_artwork_script_and_return_decoded_result("getNFTIds", args=[["Address", address(user)]])) == expected_ids
+
+@pytest.mark.core
+def test_owner_index():
+  # Deploy contracts
+  main()
+
+  setup_async_resources("User1")
+  setup_async_resources("User2")
+  setup_async_resources("User3")
+
+  assert_owner_index("User1", [])
+
+  whitelist(["User1", "1", "1", "0.01"], "AsyncArtAccount", True)
+  mint_master_token(["1", "<uri>", ["User2"], []], "User1", True)
+  assert_owner_index("User1", [1])
+  assert_owner_index("User2", [])
+
+  mint_control_token(["2", "<uri>", ["1"], ["10"], ["5"], "5", []], "User2", True, "{}")
+  assert_owner_index("User2", [2])
+
+  # Transfers move tokens between owners in the index
+  transfer_nft(["1", "User3"], "User1", True)
+  assert_owner_index("User1", [])
+  assert_owner_index("User3", [1])
+
+  transfer_nft(["2", "User3"], "User2", True)
+  assert_owner_index("User2", [])
+  assert_owner_index("User3", [1, 2])
+
+  transfer_nft(["1", "User1"], "User3", True)
+  assert_owner_index("User1", [1])
+  assert_owner_index("User3", [2])
+
+  # Destroyed tokens leave the index
+  assert send_async_artwork_transaction("destroyAsyncArtworkCollection", signer="User3")
+  assert send_async_artwork_script_and_return_decoded_result("getTokenIdsByOwner", args=[["Address", address("User3")]]) == []
+  assert send_async_artwork_script_and_return_decoded_result("getTokenCountByOwner", args=[["Address", address("User3")]]) == 0
+  assert_owner_index("User1", [1])
+
+if __name__ == '__main__':
+  test_owner_index()
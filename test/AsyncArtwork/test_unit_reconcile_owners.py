@@ -0,0 +1,71 @@
+from initialize_testing_environment import main
+from transaction_handler import send_async_artwork_transaction
+from script_handler import send_async_artwork_script_and_return_decoded_result
+from owner_reconciliation import UnknownOwnerError, find_holders, find_uncertain_owners, iter_uncertain_nfts, reconcile_owners
+from utils import address
+import pytest
+
+# Test specific setup functions
+from test_unit_setup_async_resources import setup_async_resources
+from test_unit_whitelist import whitelist
+from test_unit_mint_master_token import mint_master_token
+
+def mint_token(token_id, creator):
+  whitelist([creator, token_id, "0", "0.01"], "AsyncArtAccount", True)
+  mint_master_token([token_id, "<uri>", [], []], creator, True)
+
+@pytest.mark.core
+def test_reconcile_owners():
+  # Deploy contracts
+  main()
+
+  setup_async_resources("User1")
+  setup_async_resources("User2")
+
+  # Nothing minted, nothing to reconcile
+  assert {} == find_uncertain_owners()
+
+  mint_token("1", "User1")
+  mint_token("2", "User2")
+  mint_token("3", "User1")
+  assert {} == find_uncertain_owners()
+
+  # Moves token 1 to another key in User1's collection, so User1 no longer holds it under its id
+  assert send_async_artwork_transaction("hideNFT", args=[["UInt64", "1"]], signer="User1")
+
+  user1 = int(address("User1"), 16)
+  for shard_size in [1, 2, 250]:
+    assert {user1: [1]} == find_uncertain_owners(shard_size=shard_size, concurrency=2)
+  assert [(1, user1)] == list(iter_uncertain_nfts(shard_size=1))
+
+  # Agrees with the unsharded script
+  assert [1] == send_async_artwork_script_and_return_decoded_result("getNFTsWithUncertainOwner")
+
+  # Token 1 is not held under its id anywhere, so there is no holder to send the update from
+  uncertain, updated = reconcile_owners(shard_size=2)
+  assert {user1: [1]} == uncertain
+  assert [] == updated
+
+  # User2's collection moves to User3, token 2 is still recorded as User2's
+  assert send_async_artwork_transaction("moveAsyncArtworkCollection", signer="User2", authorizers=["User3"])
+  user2 = int(address("User2"), 16)
+  user3 = int(address("User3"), 16)
+  assert {user1: [1], user2: [2]} == find_uncertain_owners()
+  assert user2 == send_async_artwork_script_and_return_decoded_result("getMetadata", args=[["UInt64", "2"]]).owner
+
+  # User3 is not a recorded owner, it is only queried because token 2 is not held by one
+  assert {"User3": {2}} == find_holders({user1: [1], user2: [2]})
+
+  # Recorded owners must be flow.json accounts
+  with pytest.raises(UnknownOwnerError):
+    find_holders({0xdeadbeef: [2]})
+
+  # The update is sent from User3, which holds token 2, and corrects its recorded owner
+  uncertain, updated = reconcile_owners(shard_size=2)
+  assert {user1: [1], user2: [2]} == uncertain
+  assert [user3] == updated
+  assert user3 == send_async_artwork_script_and_return_decoded_result("getMetadata", args=[["UInt64", "2"]]).owner
+  assert {user1: [1]} == find_uncertain_owners()
+
+if __name__ == '__main__':
+  test_reconcile_owners()
@@ -1,7 +1,6 @@
 from initialize_testing_environment import main
 from transaction_handler import send_async_artwork_transaction
 from script_handler import send_async_artwork_script_and_return_result
-from event_handler import check_for_event
 from utils import address
 import json
 import pytest
@@ -21,10 +20,11 @@ def transfer_nft(args, signer, should_succeed):
   assert send_async_artwork_script_and_return_result("getNFT", args=[["Address", address(signer)], ["UInt64", args[0]]])
 
   if should_succeed:
-    assert send_async_artwork_transaction("transferNFT", args=transfer_args, signer=signer)
+    txn_result = send_async_artwork_transaction("transferNFT", args=transfer_args, signer=signer)
+    assert txn_result
     assert send_async_artwork_script_and_return_result("getNFT", args=[["Address", address(args[1])], ["UInt64", args[0]]])
     event = f'A.{address("AsyncArtwork")[2:]}.AsyncArtwork.Deposit'
-    assert check_for_event(event)
+    assert txn_result.has_event(event)
     
     print("Successfully Transferred NFT")
   else:
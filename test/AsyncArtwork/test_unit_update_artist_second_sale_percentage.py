@@ -1,7 +1,6 @@
 from initialize_testing_environment import main
 from transaction_handler import send_async_artwork_transaction
 from script_handler import send_async_artwork_script_and_return_result
-from event_handler import check_for_event
 from utils import address
 import pytest
 
@@ -11,9 +10,10 @@ def update_artist_second_sale_percentage(args, signer, should_succeed):
   newArtistSecondSalePercentage = [["UFix64", args[0]]]
 
   if should_succeed:
-    assert send_async_artwork_transaction("updateArtistSecondSalePercentage", args=newArtistSecondSalePercentage, signer=signer)
+    txn_result = send_async_artwork_transaction("updateArtistSecondSalePercentage", args=newArtistSecondSalePercentage, signer=signer)
+    assert txn_result
     assert float(args[0]) == float(send_async_artwork_script_and_return_result("getArtistSecondSalePercentage"))
-    assert check_for_event(f'A.{address("AsyncArtwork")[2:]}.AsyncArtwork.ArtistSecondSalePercentUpdated')
+    assert txn_result.has_event(f'A.{address("AsyncArtwork")[2:]}.AsyncArtwork.ArtistSecondSalePercentUpdated')
     print("Successfully Updated Artist Second Sale Percentage")
   else:
     assert not send_async_artwork_transaction("updateArtistSecondSalePercentage", args=newArtistSecondSalePercentage, signer=signer)
@@ -1,7 +1,6 @@
 from initialize_testing_environment import main
 from transaction_handler import send_async_artwork_transaction
 from script_handler import send_async_artwork_script_and_return_result
-from event_handler import check_for_event
 from utils import address
 import pytest
 
@@ -10,9 +9,10 @@ import pytest
 def update_platform_default_sales_percentage(args, signer, should_succeed):
   newPlatformFeePercentages = [["UFix64", args[0]]]
   if should_succeed:
-    assert send_async_artwork_transaction("updatePlatformFeePercentages", args=newPlatformFeePercentages, signer=signer)
+    txn_result = send_async_artwork_transaction("updatePlatformFeePercentages", args=newPlatformFeePercentages, signer=signer)
+    assert txn_result
     assert float(args[0])== float(send_async_artwork_script_and_return_result("getDefaultPlatformSecondSalePercentage"))
-    assert check_for_event(f'A.{address("AsyncArtwork")[2:]}.AsyncArtwork.DefaultPlatformSalePercentageUpdated')
+    assert txn_result.has_event(f'A.{address("AsyncArtwork")[2:]}.AsyncArtwork.DefaultPlatformSalePercentageUpdated')
     print("Successfully Updated Default Platform Sales Percentage")
   else:
     assert not send_async_artwork_transaction("updatePlatformFeePercentages", args=newPlatformFeePercentages, signer=signer)
@@ -1,7 +1,6 @@
 from initialize_testing_environment import main
 from transaction_handler import send_async_artwork_transaction
 from script_handler import send_async_artwork_script_and_return_result
-from event_handler import check_for_event
 from metadata_handler import result_equals_expected_metadata
 from utils import address
 import json
@@ -27,9 +26,10 @@ def use_control_token(args, signer, should_succeed, expected_metadata="", assert
   ]
 
   if should_succeed:
-    assert send_async_artwork_transaction("useControlToken", args=use_args, signer=signer)
+    txn_result = send_async_artwork_transaction("useControlToken", args=use_args, signer=signer)
+    assert txn_result
     event = f'A.{address("AsyncArtwork")[2:]}.AsyncArtwork.ControlLeverUpdated'
-    assert check_for_event(event)
+    assert txn_result.has_event(event)
     metadata = send_async_artwork_script_and_return_result("getMetadata", args=[["UInt64", args[0]]])
     print("Updated METADATA")
     print(metadata)
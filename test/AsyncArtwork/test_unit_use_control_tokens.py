@@ -0,0 +1,92 @@
+from initialize_testing_environment import main
+from transaction_handler import send_async_artwork_transaction
+from script_handler import send_async_artwork_script_and_return_decoded_result
+from utils import address, transfer_flow_token
+from decimal import Decimal
+import pytest
+
+# Test specific setup functions
+from test_unit_setup_async_resources import setup_async_resources
+from test_unit_whitelist import whitelist
+from test_unit_mint_master_token import mint_master_token
+from test_unit_mint_control_token import mint_control_token
+from test_unit_grant_control_permission import grant_control_permission
+
+# expected args: [ids, leverIds (one list per token), newLeverValues (one list per token), tip]
+
+def use_control_tokens(args, signer, should_succeed, expected_lever_values=None):
+  lever_ids = [["Array", [["UInt64", lever_id] for lever_id in token_lever_ids]] for token_lever_ids in args[1]]
+  new_lever_values = [["Array", [["Int64", value] for value in token_values]] for token_values in args[2]]
+  use_args = [
+    ["Array", [["UInt64", token_id] for token_id in args[0]]],
+    ["Array", lever_ids],
+    ["Array", new_lever_values],
+    ["UFix64", args[3]]
+  ]
+
+  if should_succeed:
+    txn_result = send_async_artwork_transaction("useControlTokens", args=use_args, signer=signer)
+    assert txn_result
+    # One event per token without a tip, then one for the batch carrying the tip
+    events = txn_result.events_of(f'A.{address("AsyncArtwork")[2:]}.AsyncArtwork.ControlLeverUpdated')
+    assert [event.get("tokenId") for event in events] == [int(token_id) for token_id in args[0]]
+    assert [event.get("priorityTip") for event in events] == [Decimal("0")] * len(events)
+    batch_events = txn_result.events_of(f'A.{address("AsyncArtwork")[2:]}.AsyncArtwork.ControlTokensBatchUpdated')
+    assert [(event.get("tokenIds"), event.get("priorityTip")) for event in batch_events] == [([int(token_id) for token_id in args[0]], Decimal(args[3]))]
+    if expected_lever_values != None:
+      for token_id, expected in zip(args[0], expected_lever_values):
+        levers = send_async_artwork_script_and_return_decoded_result("getMetadataLevers", args=[["UInt64", token_id]])
+        assert {lever_id: lever.currentValue for lever_id, lever in levers.items()} == expected
+    print("Successfully Updated Control Tokens")
+  else:
+    assert not send_async_artwork_transaction("useControlTokens", args=use_args, signer=signer)
+    print("Updating Control Tokens Failed as Expected")
+
+@pytest.mark.core
+def test_use_control_tokens():
+  # Deploy contracts
+  main()
+
+  setup_async_resources("User1")
+  setup_async_resources("User2")
+  setup_async_resources("User3")
+
+  # Master token 1 with control tokens 2 and 3 for User2, 4 for User3
+  whitelist(["User1", "1", "3", "0.01"], "AsyncArtAccount", True)
+  mint_master_token(["1", "<uri>", ["User2", "User2", "User3"], []], "User1", True)
+
+  mint_control_token(["2", "<uri>", ["1", "1"], ["10", "20"], ["3", "18"], "5", []], "User2", True, "{3: 0}")
+  mint_control_token(["3", "<uri>", ["0"], ["100"], ["50"], "5", []], "User2", True, "{}")
+  mint_control_token(["4", "<uri>", ["0"], ["100"], ["50"], "5", []], "User3", True, "{}")
+
+  # Token and lever arrays of different lengths are rejected
+  use_control_tokens([["2", "3"], [["0"]], [["5"]], "0.0"], "User2", False)
+  use_control_tokens([["2"], [["0", "1"]], [["5"]], "0.0"], "User2", False)
+
+  # An empty batch is rejected
+  use_control_tokens([[], [], [], "0.0"], "User2", False)
+
+  # A token the signer cannot control fails the whole batch, including the tokens it may control
+  use_control_tokens([["2", "4"], [["0"], ["0"]], [["5"], ["60"]], "0.0"], "User2", False)
+  assert 3 == send_async_artwork_script_and_return_decoded_result("getMetadataLevers", args=[["UInt64", "2"]])[0].currentValue
+
+  # Owner updates both of its tokens in one transaction
+  use_control_tokens(
+    [["2", "3"], [["0", "1"], ["0"]], [["5", "17"], ["75"]], "0.0"],
+    "User2",
+    True,
+    expected_lever_values=[{0: 5, 1: 17}, {0: 75}]
+  )
+
+  # A permissioned controller can batch tokens of different owners, with a single tip
+  grant_control_permission(["4", "User2", True], "User3", True, "{4: 0}")
+  transfer_flow_token("User2", "10.0", "emulator-account")
+  use_control_tokens(
+    [["4", "2"], [["0"], ["1"]], [["10"], ["20"]], "1.0"],
+    "User2",
+    True,
+    expected_lever_values=[{0: 10}, {0: 5, 1: 20}]
+  )
+
+if __name__ == '__main__':
+  test_use_control_tokens()
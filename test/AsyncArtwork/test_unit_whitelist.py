@@ -2,7 +2,6 @@ from initialize_testing_environment import main
 from transaction_handler import send_async_artwork_transaction
 from script_handler import send_async_artwork_script, send_async_artwork_script_and_return_result
 from metadata_handler import result_equals_expected_metadata
-from event_handler import check_for_event
 from utils import address
 import json
 import pytest
@@ -16,13 +15,14 @@ def whitelist(args, signer, should_succeed, expected_master_mint_res=None):
   creator_address = address(args[0])
   args = [["Address", creator_address], ["UInt64", args[1]], ["UInt64", args[2]], ["UFix64?", args[3]]]
   if should_succeed:
-    assert send_async_artwork_transaction("whitelist", args=args, signer=signer)
+    txn_result = send_async_artwork_transaction("whitelist", args=args, signer=signer)
+    assert txn_result
     metadata = send_async_artwork_script_and_return_result("getMasterMintReservation", args=[["Address", creator_address]])
     if expected_master_mint_res != None:
       assert result_equals_expected_metadata(metadata, expected_master_mint_res)
     # Checks that the metadata entry here is non-empty
     assert send_async_artwork_script("getMetadata", args=[args[1]])
-    assert check_for_event(f'A.{address("AsyncArtwork")[2:]}.AsyncArtwork.CreatorWhitelisted')
+    assert txn_result.has_event(f'A.{address("AsyncArtwork")[2:]}.AsyncArtwork.CreatorWhitelisted')
     print("Successfuly Whitelisted Token For Creator")
   else:
     assert not send_async_artwork_transaction("whitelist", args=args, signer=signer)
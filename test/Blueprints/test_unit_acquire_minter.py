@@ -1,6 +1,5 @@
 from initialize_testing_environment import main
 from transaction_handler import send_blueprints_transaction
-from event_handler import check_for_event
 import pytest
 
 def acquire_minter(signer):
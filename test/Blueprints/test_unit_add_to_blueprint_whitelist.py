@@ -1,7 +1,6 @@
 from initialize_testing_environment import main
 from transaction_handler import send_blueprints_transaction
 from script_handler import send_blueprints_script_and_return_result
-from event_handler import check_for_event
 from utils import address, transfer_flow_token
 import pytest
 
@@ -18,9 +17,10 @@ def add_to_whitelist(blueprintID, args, signer, should_succeed):
   formatted_args.insert(0, ["UInt64", blueprintID])
   
   if should_succeed:
-    assert send_blueprints_transaction("addToBlueprintWhitelist", args=formatted_args, signer=signer)
+    txn_result = send_blueprints_transaction("addToBlueprintWhitelist", args=formatted_args, signer=signer)
+    assert txn_result
     event = f'A.{address("AsyncArtwork")[2:]}.Blueprints.BlueprintWhitelistUpdated'
-    assert check_for_event(event)
+    assert txn_result.has_event(event)
     print("Successfully Added Addresses to Whitelist for Blueprint")
   else:
     assert not send_blueprints_transaction("addToBlueprintWhitelist", args=formatted_args, signer=signer)
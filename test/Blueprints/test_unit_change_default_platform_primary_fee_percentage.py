@@ -1,7 +1,6 @@
 from initialize_testing_environment import main
 from transaction_handler import send_blueprints_transaction
 from script_handler import send_blueprints_script_and_return_result
-from event_handler import check_for_event
 from utils import address
 import pytest
 
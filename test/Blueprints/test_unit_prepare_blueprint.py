@@ -1,7 +1,6 @@
 from initialize_testing_environment import main
 from transaction_handler import send_blueprints_transaction
 from script_handler import send_blueprints_script_and_return_result
-from event_handler import check_for_event
 from utils import address
 import pytest
 
@@ -27,9 +26,10 @@ def prepare_blueprint(args, signer, should_succeed):
                       ["UInt64", args[8]], ["UInt64", args[9]]]
   
   if should_succeed:
-    assert send_blueprints_transaction("prepareBlueprint", args=formatted_args, signer=signer)
+    txn_result = send_blueprints_transaction("prepareBlueprint", args=formatted_args, signer=signer)
+    assert txn_result
     event = f'A.{address("AsyncArtwork")[2:]}.Blueprints.BlueprintPrepared'
-    assert check_for_event(event)
+    assert txn_result.has_event(event)
     print("Successfully Prepared Blueprint As Expected")
   else:
     assert not send_blueprints_transaction("prepareBlueprint", args=formatted_args, signer=signer)
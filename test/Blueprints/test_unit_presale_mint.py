@@ -1,7 +1,6 @@
 from initialize_testing_environment import main
 from transaction_handler import send_blueprints_transaction
 from script_handler import send_blueprints_script_and_return_result
-from event_handler import check_for_event, check_for_n_event_occurences_over_x_blocks
 from utils import address
 import pytest
 
@@ -17,9 +16,9 @@ def presale_mint(args, signer, should_succeed):
   formatted_args = [["UInt64", args[0]], ["UInt64", args[1]]]
   
   if should_succeed:
-    assert send_blueprints_transaction("presaleMint", args=formatted_args, signer=signer)
-    event = f'A.{address("AsyncArtwork")[2:]}.Blueprints.BlueprintMinted'
-    assert check_for_n_event_occurences_over_x_blocks(args[1], int(args[1]), event)
+    txn_result = send_blueprints_transaction("presaleMint", args=formatted_args, signer=signer)
+    assert txn_result
+    assert txn_result.has_event(f'A.{address("AsyncArtwork")[2:]}.Blueprints.BlueprintMinted', int(args[1]))
     print("Successfully Completed Pre-Sale Mint")
   else:
     assert not send_blueprints_transaction("presaleMint", args=formatted_args, signer=signer)
@@ -1,7 +1,6 @@
 from initialize_testing_environment import main
 from transaction_handler import send_blueprints_transaction
 from script_handler import send_blueprints_script_and_return_result, send_script_and_return_result
-from event_handler import check_for_event, check_for_n_event_occurences_over_x_blocks
 from utils import address, transfer_flow_token
 import pytest
 
@@ -12,16 +11,26 @@ from test_unit_begin_sale import begin_sale
 
 # args:
 # blueprintID: UInt64, quantity: UInt64, recipient: Address
-def purchase_blueprints(args, signer, should_succeed):
+# batched purchases emit only the BlueprintsBatchMinted summary instead of one BlueprintMinted event per token
+def purchase_blueprints(args, signer, should_succeed, batched=False):
   formatted_args = [["UInt64", args[0]], ["UInt64", args[1]], ["Address", address(args[2])]]
+  txname = "purchaseBlueprintsBatched" if batched else "purchaseBlueprints"
   
   if should_succeed:
-    assert send_blueprints_transaction("purchaseBlueprints", args=formatted_args, signer=signer)
-    event = f'A.{address("AsyncArtwork")[2:]}.Blueprints.BlueprintMinted'
-    assert check_for_n_event_occurences_over_x_blocks(args[1], int(args[1]), event)
+    txn_result = send_blueprints_transaction(txname, args=formatted_args, signer=signer)
+    assert txn_result
+    batch_events = txn_result.events_of(f'A.{address("AsyncArtwork")[2:]}.Blueprints.BlueprintsBatchMinted', blueprintID=int(args[0]), purchaser=int(address(args[2]), 16))
+    minted_events = txn_result.events_of(f'A.{address("AsyncArtwork")[2:]}.Blueprints.BlueprintMinted', blueprintID=int(args[0]), purchaser=int(address(args[2]), 16))
+    if batched:
+      assert len(batch_events) == 1 and batch_events[0].get("count") == int(args[1])
+      assert len(minted_events) == 0
+    else:
+      assert len(batch_events) == 0
+      assert len(minted_events) == int(args[1])
     print("Successfully Purchased Blueprints")
+    return txn_result
   else:
-    assert not send_blueprints_transaction("purchaseBlueprints", args=formatted_args, signer=signer)
+    assert not send_blueprints_transaction(txname, args=formatted_args, signer=signer)
     print("Failed to Purchase Blueprints As Expected")
 
 @pytest.mark.core
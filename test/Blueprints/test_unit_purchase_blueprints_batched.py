@@ -0,0 +1,61 @@
+from initialize_testing_environment import main
+from script_handler import send_blueprints_script_and_return_result, send_blueprints_script_and_return_decoded_result
+from utils import address, transfer_flow_token
+import hashlib
+import pytest
+
+from test_unit_setup_async_resources import setup_async_resources
+from test_unit_prepare_blueprint import prepare_blueprint
+from test_unit_begin_sale import begin_sale
+from test_unit_purchase_blueprints import purchase_blueprints
+
+# The seed prefixes of count tokens minted together, derived from the seed root of their BlueprintsBatchMinted event
+def derive_seed_prefixes(seed_root, count):
+  prefixes = [bytes(seed_root)]
+  while len(prefixes) < count:
+    prefixes.append(hashlib.sha3_256(prefixes[-1]).digest())
+  return [list(prefix) for prefix in prefixes]
+
+@pytest.mark.core
+def test_purchase_blueprints_batched():
+  # Deploy contracts
+  main()
+
+  prepare_blueprint(
+    ["User1", "30", "1.0", "A.0ae53cb6e3f42a79.FlowToken.Vault", "metadata", "https://token-uri.com", [], "0", "0", "25"],
+    "AsyncArtAccount",
+    True
+  )
+  begin_sale("0", "AsyncArtAccount", True)
+
+  transfer_flow_token("User2", "100.0", "emulator-account")
+  setup_async_resources("User2")
+
+  batch_event = f'A.{address("AsyncArtwork")[2:]}.Blueprints.BlueprintsBatchMinted'
+  minted_event = f'A.{address("AsyncArtwork")[2:]}.Blueprints.BlueprintMinted'
+
+  # Per token events carry the seed prefixes of the mint's hash chain, starting from its seed root
+  txn_result = purchase_blueprints(["0", "3", "User2"], "User2", True)
+  minted = txn_result.events_of(minted_event)
+  assert [event.get("tokenId") for event in minted] == [0, 1, 2]
+  assert [event.get("newCapacity") for event in minted] == [30, 29, 28]
+  assert [event.get("seedPrefix") for event in minted] == derive_seed_prefixes(minted[0].get("seedPrefix"), 3)
+
+  # A batched purchase only emits the summary
+  txn_result = purchase_blueprints(["0", "25", "User2"], "User2", True, batched=True)
+  batch = txn_result.events_of(batch_event)[0]
+  assert batch.get("firstTokenId") == 3
+  assert batch.get("newCapacity") == 2
+  for token_id in ["3", "15", "27"]:
+    assert f"id: {token_id}" in send_blueprints_script_and_return_result("getNFT", args=[["Address", address("User2")], ["UInt64", token_id]])
+
+  blueprint = send_blueprints_script_and_return_decoded_result("getBlueprint", args=[["UInt64", "0"]])
+  assert blueprint.nftIndex == 28
+  assert blueprint.capacity == 2
+
+  # Batched purchases are still bound by maxPurchaseAmount and capacity
+  purchase_blueprints(["0", "3", "User2"], "User2", False, batched=True)
+  purchase_blueprints(["0", "2", "User2"], "User2", True, batched=True)
+
+if __name__ == '__main__':
+  test_purchase_blueprints_batched()
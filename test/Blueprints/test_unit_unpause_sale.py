@@ -1,7 +1,6 @@
 from initialize_testing_environment import main
 from transaction_handler import send_blueprints_transaction
 from script_handler import send_blueprints_script_and_return_result
-from event_handler import check_for_event
 from utils import address, transfer_flow_token
 import pytest
 
@@ -18,9 +17,10 @@ def unpause_sale(arg, signer, should_succeed):
   formatted_args = [["UInt64", arg]]
   
   if should_succeed:
-    assert send_blueprints_transaction("unpauseSale", args=formatted_args, signer=signer)
+    txn_result = send_blueprints_transaction("unpauseSale", args=formatted_args, signer=signer)
+    assert txn_result
     event = f'A.{address("AsyncArtwork")[2:]}.Blueprints.SaleUnpaused'
-    assert check_for_event(event)
+    assert txn_result.has_event(event)
     print("Successfully Unpaused Sale for Blueprint")
   else:
     assert not send_blueprints_transaction("unpauseSale", args=formatted_args, signer=signer)
@@ -1,7 +1,6 @@
 from initialize_testing_environment import main
 from transaction_handler import send_blueprints_transaction
 from script_handler import send_blueprints_script_and_return_result
-from event_handler import check_for_event
 from utils import address
 import pytest
 
@@ -20,9 +19,10 @@ def update_blueprint_settings(args, signer, should_succeed):
   formatted_args = [["UInt64", args[0]], ["UFix64", args[1]], ["UInt64", args[2]], ["UInt64", args[3]], ["UInt8", args[4]], ["UInt64", args[5]]]
   
   if should_succeed:
-    assert send_blueprints_transaction("updateBlueprintSettings", args=formatted_args, signer=signer)
+    txn_result = send_blueprints_transaction("updateBlueprintSettings", args=formatted_args, signer=signer)
+    assert txn_result
     event = f'A.{address("AsyncArtwork")[2:]}.Blueprints.BlueprintSettingsUpdated'
-    assert check_for_event(event)
+    assert txn_result.has_event(event)
     print("Successfully Updated Blueprint Settings")
   else:
     assert not send_blueprints_transaction("updateBlueprintSettings", args=formatted_args, signer=signer)
@@ -1,7 +1,6 @@
 from initialize_testing_environment import main
 from transaction_handler import send_blueprints_transaction
 from script_handler import send_blueprints_script_and_return_result
-from event_handler import check_for_event
 from utils import address
 import pytest
 
@@ -16,9 +15,10 @@ def update_token_uri(args, signer, should_succeed):
   formatted_args = [["UInt64", args[0]], ["String", args[1]]]
   
   if should_succeed:
-    assert send_blueprints_transaction("updateTokenUri", args=formatted_args, signer=signer)
+    txn_result = send_blueprints_transaction("updateTokenUri", args=formatted_args, signer=signer)
+    assert txn_result
     event = f'A.{address("AsyncArtwork")[2:]}.Blueprints.BlueprintTokenUriUpdated'
-    assert check_for_event(event)
+    assert txn_result.has_event(event)
     print("Successfully Updated Token URI")
   else:
     assert not send_blueprints_transaction("updateTokenUri", args=formatted_args, signer=signer)
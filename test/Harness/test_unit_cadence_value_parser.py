@@ -0,0 +1,63 @@
+from metadata_handler import CadenceParseError, CadenceValueParser, canonicalize, result_equals_expected_metadata
+import pytest
+
+# Offline tests for the structural comparison of printed Cadence values, no emulator needed
+
+LEVER = "A.01cf0e2f2f715450.AsyncArtwork.ControlLever"
+
+def metadata(levers, owner="0x179b6b1cb6755e31", remaining="5"):
+  return (
+    'A.01cf0e2f2f715450.AsyncArtwork.NFTMetadata(id: 2, isMaster: false, uri: "<uri>", numRemainingUpdates: ' + remaining +
+    ', owner: ' + owner + ', levers: ' + levers + ', uniqueTokenCreators: [0x01cf0e2f2f715450, 0xf3fcd2c1a78f5eee])'
+  )
+
+@pytest.mark.core
+def test_parse_values():
+  assert ('literal', '42') == canonicalize("42")
+  assert ('str', '"a, b: (c)"') == canonicalize(' "a, b: (c)" ')
+  assert ('str', r'"say \"hi\""') == canonicalize(r'"say \"hi\""')
+  assert ('array', (('literal', '1'), ('array', ()), ('array', (('literal', '2'),)))) == canonicalize("[1, [], [2]]")
+  assert ('composite', LEVER, (('minValue', ('literal', '1')), ('maxValue', ('literal', '10')))) == canonicalize(f"{LEVER}(minValue: 1, maxValue: 10)")
+
+@pytest.mark.core
+def test_dictionary_key_order_is_canonical():
+  assert canonicalize('{"b": 2, "a": 1, "c": 3}') == canonicalize('{"c": 3, "a": 1, "b": 2}')
+  assert canonicalize("{}") == canonicalize(" { } ")
+
+  # Nested dictionaries, arrays of dictionaries and dictionaries of composites are sorted at every level
+  assert canonicalize('{1: {"y": [1, 2], "x": {}}, 0: [{"b": 1, "a": 2}]}') == canonicalize('{0: [{"a": 2, "b": 1}], 1: {"x": {}, "y": [1, 2]}}')
+  levers = f"{{0: {LEVER}(minValue: 1, maxValue: 10, currentValue: 3), 1: {LEVER}(minValue: 1, maxValue: 20, currentValue: 18)}}"
+  reordered = f"{{1: {LEVER}(minValue: 1, maxValue: 20, currentValue: 18), 0: {LEVER}(minValue: 1, maxValue: 10, currentValue: 3)}}"
+  assert result_equals_expected_metadata(metadata(levers), metadata(reordered))
+
+  # Array elements and struct fields keep their order
+  assert canonicalize("[1, 2]") != canonicalize("[2, 1]")
+  assert canonicalize(f"{LEVER}(minValue: 1, maxValue: 10)") != canonicalize(f"{LEVER}(maxValue: 10, minValue: 1)")
+
+@pytest.mark.core
+def test_optionals():
+  # Optionals print as nil or as the bare value
+  assert result_equals_expected_metadata(metadata("{}", owner="nil", remaining="nil"), metadata("{}", owner="nil", remaining="nil"))
+  assert not result_equals_expected_metadata(metadata("{}", owner="nil"), metadata("{}"))
+  assert not result_equals_expected_metadata(metadata("{}", remaining="nil"), metadata("{}", remaining="5"))
+  assert ('dict', ((('literal', '1'), ('literal', 'nil')),)) == canonicalize("{1: nil}")
+
+@pytest.mark.core
+def test_mismatches():
+  levers = f"{{0: {LEVER}(minValue: 1, maxValue: 10, currentValue: 3)}}"
+  assert not result_equals_expected_metadata(metadata(levers), metadata(levers.replace("currentValue: 3", "currentValue: 4")))
+  assert not result_equals_expected_metadata(metadata(levers), metadata("{}"))
+  assert not result_equals_expected_metadata(metadata('{"a": 1}'), metadata('{"a": 1, "b": 2}'))
+  assert not result_equals_expected_metadata(None, metadata("{}"))
+
+  # Malformed input does not compare equal, and raises from the parser itself
+  assert not result_equals_expected_metadata(metadata(levers), metadata(levers)[:-1])
+  for malformed in ["[1, 2", '{"a" 1}', '"open', "1 2", "(", ""]:
+    with pytest.raises(CadenceParseError):
+      CadenceValueParser(malformed).parse()
+
+if __name__ == '__main__':
+  test_parse_values()
+  test_dictionary_key_order_is_canonical()
+  test_optionals()
+  test_mismatches()
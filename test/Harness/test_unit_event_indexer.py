@@ -0,0 +1,131 @@
+from event_indexer import MAX_BLOCK_RANGE, EventIndexer, decode_event
+from urllib.parse import parse_qs, urlparse
+import base64
+import json
+import pytest
+
+# Offline tests for the event index, fed by a fake access API client instead of the emulator
+
+DEPOSIT = "A.01cf0e2f2f715450.AsyncArtwork.Deposit"
+WITHDRAW = "A.01cf0e2f2f715450.AsyncArtwork.Withdraw"
+
+def event_payload(event_type, id, address):
+  return base64.b64encode(json.dumps({"type": "Event", "value": {"id": event_type, "fields": [
+    {"name": "id", "value": {"type": "UInt64", "value": str(id)}},
+    {"name": "to" if event_type == DEPOSIT else "from", "value": {"type": "Optional", "value": {"type": "Address", "value": address}}}
+  ]}}).encode()).decode()
+
+class FakeClient:
+  def __init__(self):
+    self.latest = 0
+    # {height: [(type, id, address)]}
+    self.blocks = {}
+    self.requests = []
+
+  def add_block(self, *events):
+    self.latest += 1
+    self.blocks[self.latest] = list(events)
+
+  def get_latest_sealed_block(self):
+    return {"height": str(self.latest)}
+
+  def request(self, method, path):
+    assert method == "GET"
+    query = {name: values[0] for name, values in parse_qs(urlparse(path).query).items()}
+    start, end = int(query["start_height"]), int(query["end_height"])
+    assert 0 <= start <= end <= self.latest and end - start < MAX_BLOCK_RANGE
+    self.requests.append((query["type"], start, end))
+    return [
+      {"block_height": str(height), "block_id": f"block{height}", "events": [
+        {"type": event_type, "transaction_id": f"tx{height}", "transaction_index": "0", "event_index": str(index), "payload": event_payload(event_type, id, address)}
+        for index, (event_type, id, address) in enumerate(self.blocks.get(height, [])) if event_type == query["type"]
+      ]}
+      for height in range(start, end + 1)
+    ]
+
+@pytest.mark.core
+def test_decode_event():
+  event = {"type": WITHDRAW, "transaction_id": "tx1", "transaction_index": "2", "event_index": "3", "payload": event_payload(WITHDRAW, 7, "0x01cf0e2f2f715450")}
+  record = decode_event(event, 12, "block12")
+  assert (record.type, record.block_height, record.block_id, record.transaction_id, record.transaction_index, record.event_index) == (WITHDRAW, 12, "block12", "tx1", 2, 3)
+  assert 7 == record.get("id")
+  # `from` is a Python keyword, it is still read by its Cadence name
+  assert 0x01cf0e2f2f715450 == record.get("from")
+
+@pytest.mark.core
+def test_events_by_type_and_height():
+  client = FakeClient()
+  client.add_block((DEPOSIT, 1, "0x01"))
+  client.add_block((WITHDRAW, 1, "0x01"), (DEPOSIT, 1, "0x02"))
+  client.add_block()
+  client.add_block((DEPOSIT, 2, "0x01"))
+  indexer = EventIndexer(client)
+
+  # Only events of the requested type are returned, in height order
+  assert [(1, 1), (2, 1), (4, 2)] == [(r.block_height, r.get("id")) for r in indexer.events(DEPOSIT)]
+  assert [2] == [r.block_height for r in indexer.events(WITHDRAW)]
+
+  # Height bounds are inclusive
+  assert [2, 4] == [r.block_height for r in indexer.events(DEPOSIT, start_height=2)]
+  assert [1, 2] == [r.block_height for r in indexer.events(DEPOSIT, end_height=3)]
+  assert [2] == [r.block_height for r in indexer.events(DEPOSIT, start_height=2, end_height=2)]
+  assert [] == indexer.events(DEPOSIT, start_height=3, end_height=3)
+
+  # Field filters take values or predicates
+  assert [1, 4] == [r.block_height for r in indexer.events(DEPOSIT, to=0x01)]
+  assert [4] == [r.block_height for r in indexer.events(DEPOSIT, id=lambda id: id > 1)]
+
+@pytest.mark.core
+def test_cursor_advances_incrementally():
+  client = FakeClient()
+  client.add_block((DEPOSIT, 1, "0x01"))
+  client.add_block()
+  indexer = EventIndexer(client)
+
+  assert 1 == len(indexer.events(DEPOSIT))
+  assert 2 == indexer.cursors[DEPOSIT]
+  assert [(DEPOSIT, 0, 2)] == client.requests
+
+  # Nothing new sealed, nothing fetched
+  assert 1 == len(indexer.events(DEPOSIT))
+  assert [(DEPOSIT, 0, 2)] == client.requests
+
+  # Only blocks sealed since the last sync are fetched, and in ranges the access API serves
+  for _ in range(MAX_BLOCK_RANGE + 10):
+    client.add_block()
+  client.add_block((DEPOSIT, 2, "0x01"))
+  client.requests.clear()
+  assert 2 == len(indexer.events(DEPOSIT))
+  assert client.latest == indexer.latest_height(DEPOSIT)
+  assert [(DEPOSIT, 3, MAX_BLOCK_RANGE + 2), (DEPOSIT, MAX_BLOCK_RANGE + 3, client.latest)] == client.requests
+
+  # Every watched type is synced, each from its own cursor
+  indexer.watch(WITHDRAW)
+  client.add_block((WITHDRAW, 2, "0x01"))
+  indexer.sync()
+  assert {DEPOSIT: client.latest, WITHDRAW: client.latest} == indexer.cursors
+  assert 1 == len(indexer.events(WITHDRAW))
+
+@pytest.mark.core
+def test_restarted_chain_is_reindexed():
+  client = FakeClient()
+  for id in range(3):
+    client.add_block((DEPOSIT, id, "0x01"))
+  indexer = EventIndexer(client)
+  assert 3 == len(indexer.events(DEPOSIT))
+
+  # A fresh emulator starts below the cursor, the old chain's events are dropped
+  restarted = FakeClient()
+  restarted.add_block((DEPOSIT, 9, "0x02"))
+  indexer.client = restarted
+  assert [9] == [r.get("id") for r in indexer.events(DEPOSIT)]
+
+  indexer.reset()
+  assert {} == indexer.cursors
+  assert [9] == [r.get("id") for r in indexer.events(DEPOSIT)]
+
+if __name__ == '__main__':
+  test_decode_event()
+  test_events_by_type_and_height()
+  test_cursor_advances_incrementally()
+  test_restarted_chain_is_reindexed()
@@ -0,0 +1,70 @@
+from flow_client import rlp_encode, transaction_payload, payload_message, envelope_message, TRANSACTION_DOMAIN_TAG
+import pytest
+
+# Offline known vectors for the in-process client's transaction encoding, no emulator needed
+
+LOREM = b"Lorem ipsum dolor sit amet, consectetur adipisicing elit"
+
+# Published RLP examples
+RLP_VECTORS = [
+  (b"", "80"),
+  (b"dog", "83646f67"),
+  ([b"cat", b"dog"], "c88363617483646f67"),
+  ([], "c0"),
+  (0, "80"),
+  (15, "0f"),
+  (1024, "820400"),
+  (b"\x00", "00"),
+  (b"\x80", "8180"),
+  ([[], [[]], [[], [[]]]], "c7c0c1c0c3c0c1c0"),
+  (LOREM, "b838" + LOREM.hex())
+]
+
+# Transaction from the Flow SDK encoding examples: proposer, payer and authorizer 0x01
+CODE = 'transaction { execute { log("Hello, World!") } }'
+REFERENCE_BLOCK_ID = "f0e4c2f76c58916ec258f246851bea091d14d4247a2fc3e18694461b1816e13b"
+ADDRESS = "0000000000000001"
+PAYLOAD_SIGNATURE = bytes.fromhex("f7225388c1d69d57e6251c9fda50cbbf9e05131e5adb81e5aa0422402f048162")
+
+ENCODED_PAYLOAD = (
+  "f872b07472616e73616374696f6e207b2065786563757465207b206c6f67282248656c6c6f2c20576f726c64212229207d207d"
+  "c0a0f0e4c2f76c58916ec258f246851bea091d14d4247a2fc3e18694461b1816e13b2a880000000000000001040a880000000000000001"
+  "c9880000000000000001"
+)
+ENCODED_ENVELOPE = "f899" + ENCODED_PAYLOAD + "e4e38004a0f7225388c1d69d57e6251c9fda50cbbf9e05131e5adb81e5aa0422402f048162"
+
+def payload():
+  return transaction_payload(CODE, [], REFERENCE_BLOCK_ID, 42, ADDRESS, 4, 10, ADDRESS, [ADDRESS])
+
+@pytest.mark.core
+def test_rlp_encode():
+  for item, expected in RLP_VECTORS:
+    assert expected == rlp_encode(item).hex(), item
+
+  # Lists whose payload is 56 bytes or longer get a length of length prefix
+  assert "f83a" + rlp_encode(LOREM).hex() == rlp_encode([LOREM]).hex()
+
+@pytest.mark.core
+def test_transaction_payload_encoding():
+  assert ENCODED_PAYLOAD == rlp_encode(payload()).hex()
+  assert TRANSACTION_DOMAIN_TAG + bytes.fromhex(ENCODED_PAYLOAD) == payload_message(payload())
+
+  # The tag is "FLOW-V0.0-transaction" right padded to 32 bytes
+  assert 32 == len(TRANSACTION_DOMAIN_TAG)
+  assert TRANSACTION_DOMAIN_TAG.startswith(b"FLOW-V0.0-transaction\x00")
+
+  # Arguments are encoded as a list of their JSON-Cadence bytes
+  with_argument = transaction_payload(CODE, [b'{"type":"Int","value":"1"}'], REFERENCE_BLOCK_ID, 42, ADDRESS, 4, 10, ADDRESS, [ADDRESS])
+  assert rlp_encode([b'{"type":"Int","value":"1"}']) in rlp_encode(with_argument)
+
+@pytest.mark.core
+def test_transaction_envelope_encoding():
+  assert TRANSACTION_DOMAIN_TAG + bytes.fromhex(ENCODED_ENVELOPE) == envelope_message(payload(), [[0, 4, PAYLOAD_SIGNATURE]])
+
+  # Without payload signatures the envelope ends in an empty list
+  assert envelope_message(payload(), []).hex().endswith(ENCODED_PAYLOAD + "c0")
+
+if __name__ == '__main__':
+  test_rlp_encode()
+  test_transaction_payload_encoding()
+  test_transaction_envelope_encoding()
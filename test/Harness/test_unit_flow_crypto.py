@@ -0,0 +1,55 @@
+from flow_crypto import G, N, P, generate_key_pair, public_key_from_private, scalar_multiply, sign, verify
+import pytest
+
+# Offline known vectors for the P-256 / SHA3-256 signing used by the in-process client, no emulator needed
+
+# RFC 6979 A.2.5, the P-256 key pair
+PRIVATE_KEY = "c9afa9d845ba75166b5c215767b1d6934e50c3db36e89b127b8a622b120f6721"
+PUBLIC_KEY = (
+  "60fed4ba255a9d31c961eb74c6356d68c049b8923b61fa6ce669622e60f29fb6"
+  "7903fe1008b8bc99a41ae9e95628bc64f2f1b20c2d7e9f5177a3c294d4462299"
+)
+# RFC 6979 A.2.5, the nonce for SHA-256 over "sample" and the r it gives
+NONCE = 0xa6e3c57dd01abe90086538398355dd4c3b17aa873382b0f24d6129493d8aad60
+NONCE_R = 0xefd48b2aacb6a8fd1140dd9cd45e81d69d2c877b56aaf991c34d0ea84eaf3716
+
+MESSAGE = b"FLOW-V0.0-transaction".ljust(32, b"\x00") + b"payload"
+
+@pytest.mark.core
+def test_curve_arithmetic():
+  assert G == scalar_multiply(1)
+  assert None == scalar_multiply(N)
+  assert scalar_multiply(N - 1) == (G[0], -G[1] % P)
+  assert NONCE_R == scalar_multiply(NONCE)[0]
+
+@pytest.mark.core
+def test_public_key_from_private():
+  assert PUBLIC_KEY == public_key_from_private(PRIVATE_KEY)
+  assert G[0].to_bytes(32, "big").hex() + G[1].to_bytes(32, "big").hex() == public_key_from_private("01")
+
+  private_key, public_key = generate_key_pair()
+  assert 64 == len(private_key) and 128 == len(public_key)
+  assert public_key == public_key_from_private(private_key)
+
+@pytest.mark.core
+def test_sign_and_verify():
+  signature = sign(PRIVATE_KEY, MESSAGE)
+  # Raw r || s, not DER
+  assert 64 == len(signature)
+  assert verify(PUBLIC_KEY, MESSAGE, signature)
+
+  # Nonces are random, every signature differs and verifies
+  other_signature = sign(PRIVATE_KEY, MESSAGE)
+  assert signature != other_signature
+  assert verify(PUBLIC_KEY, MESSAGE, other_signature)
+
+  # A changed message, signature or key is rejected
+  assert not verify(PUBLIC_KEY, MESSAGE + b"!", signature)
+  assert not verify(PUBLIC_KEY, MESSAGE, signature[:63] + bytes([signature[63] ^ 1]))
+  assert not verify(PUBLIC_KEY, MESSAGE, bytes(32) + signature[32:])
+  assert not verify(public_key_from_private(generate_key_pair()[0]), MESSAGE, signature)
+
+if __name__ == '__main__':
+  test_curve_arithmetic()
+  test_public_key_from_private()
+  test_sign_and_verify()
@@ -0,0 +1,80 @@
+from initialize_testing_environment import main
+from script_handler import send_nft_auction_script_and_return_decoded_result, send_async_artwork_script_and_return_result
+from auction_keeper import AuctionKeeper
+from utils import address, transfer_flow_token
+import time
+import pytest
+
+from test_unit_setup_async_resources import setup_async_resources
+from test_unit_whitelist import whitelist
+from test_unit_mint_master_token import mint_master_token
+from test_unit_make_nft_auction import create_new_nft_auction
+from test_unit_make_bid import make_bid
+from test_unit_withdraw_bid import withdraw_bid
+from test_unit_settle_auctions import settle_auctions
+
+KEEPER_TIMEOUT = 60
+
+@pytest.mark.core
+def test_auction_keeper():
+  # Deploy contracts
+  main()
+
+  setup_async_resources("User1")
+  setup_async_resources("User2")
+  setup_async_resources("User3")
+  transfer_flow_token("User2", "100.0", "emulator-account")
+
+  nft_type = "A.01cf0e2f2f715450.AsyncArtwork.NFT"
+
+  for token_id in ["1", "2", "3"]:
+    whitelist(["User1", token_id, "0", "0.01"], "AsyncArtAccount", True)
+    mint_master_token([token_id, "<uri>", [], []], "User1", True)
+    create_new_nft_auction(
+      [nft_type, token_id, "A.0ae53cb6e3f42a79.FlowToken.Vault", "2.0", "5.0", "0.00000001", "5.0", ["AsyncArtAccount"], ["0.05"]],
+      "User1",
+      True
+    )
+
+  # Auctions 1 and 2 end with their bids, auction 3 never gets a bid and so never ends
+  keeper = AuctionKeeper("User3")
+  make_bid([nft_type, "1", "A.0ae53cb6e3f42a79.FlowToken.Vault", "4.0"], "User2", True)
+  make_bid([nft_type, "2", "A.0ae53cb6e3f42a79.FlowToken.Vault", "4.0"], "User2", True)
+
+  # Nothing is settleable yet
+  assert keeper.run_once() == 0
+  assert keeper.next_due_in() > 0
+
+  deadline = time.time() + KEEPER_TIMEOUT
+  keeper.run(stop=lambda: len(keeper.settled) == 2 or time.time() > deadline)
+  assert sorted(keeper.settled) == [(nft_type, 1), (nft_type, 2)]
+  assert keeper.next_due_in() is None
+  print(keeper.lag_summary())
+  assert keeper.lag_summary()['max'] < keeper.poll_interval + 5
+
+  user2_owned_nfts = send_async_artwork_script_and_return_result("getNFTs", args=[["Address", address("User2")]])
+  assert "id: 1" in user2_owned_nfts and "id: 2" in user2_owned_nfts
+  for token_id in ["1", "2"]:
+    auction = send_nft_auction_script_and_return_decoded_result("getAuction", args=[["String", nft_type], ["UInt64", token_id]])
+    assert auction.nftHighestBid is None
+
+  # Settled and unended auctions are skipped without failing the batch
+  assert settle_auctions([[nft_type, nft_type], ["1", "3"]], "User3", True) == [False, False]
+
+  # A bid under the minimum price is withdrawn, auction 3 stays tracked and is settled once a later bid ends it
+  make_bid([nft_type, "3", "A.0ae53cb6e3f42a79.FlowToken.Vault", "1.0"], "User2", True)
+  withdraw_bid([nft_type, "3"], "User2", True)
+  assert keeper.run_once() == 0
+  assert keeper.auctions[(nft_type, 3)] is None
+  make_bid([nft_type, "3", "A.0ae53cb6e3f42a79.FlowToken.Vault", "1.0"], "User2", True)
+  assert keeper.run_once() == 0
+  assert keeper.auctions[(nft_type, 3)] is None
+  make_bid([nft_type, "3", "A.0ae53cb6e3f42a79.FlowToken.Vault", "4.0"], "User2", True)
+
+  deadline = time.time() + KEEPER_TIMEOUT
+  keeper.run(stop=lambda: len(keeper.settled) == 3 or time.time() > deadline)
+  assert keeper.settled[-1] == (nft_type, 3)
+  assert keeper.next_due_in() is None
+
+if __name__ == '__main__':
+  test_auction_keeper()
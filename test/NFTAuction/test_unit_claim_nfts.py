@@ -1,7 +1,7 @@
 from initialize_testing_environment import main
-from transaction_handler import send_transaction, send_nft_auction_transaction, send_async_artwork_transaction
+from transaction_handler import send_nft_auction_transaction, send_async_artwork_transaction
 from script_handler import send_script, send_script_and_return_result, send_async_artwork_script_and_return_result
-from event_handler import check_for_event
+from time_control import advance_past_auction_end
 from utils import address, transfer_flow_token
 import pytest
 
@@ -65,8 +65,7 @@ def test_claim_nfts():
   # User2 unlinks their NFT receiver capability
   send_async_artwork_transaction("unlinkAsyncArtworkNFTCollectionPublicCapability", signer="User2")
 
-  for i in range(120):
-    send_transaction("simulateTimeDelay")
+  advance_past_auction_end("A.01cf0e2f2f715450.AsyncArtwork.NFT", "1")
 
   settle_auction(
     ["A.01cf0e2f2f715450.AsyncArtwork.NFT", "1"],
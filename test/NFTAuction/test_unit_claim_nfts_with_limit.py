@@ -0,0 +1,80 @@
+from initialize_testing_environment import main
+from transaction_handler import send_nft_auction_transaction, send_async_artwork_transaction, drain_nft_claims
+from script_handler import send_nft_auction_script_and_return_decoded_result
+from time_control import advance_past_auction_end
+from utils import address, transfer_flow_token
+import pytest
+
+from test_unit_setup_async_resources import setup_async_resources
+from test_unit_whitelist import whitelist
+from test_unit_mint_master_token import mint_master_token
+from test_unit_make_nft_auction import create_new_nft_auction
+from test_unit_make_bid import make_bid
+from test_unit_settle_auction import settle_auction
+
+# expected args: [nftTypeIdentifier, limit]
+
+def claim_nfts_with_limit(args, signer, should_succeed):
+  txn_args = [["String", args[0]], ["UInt64", args[1]]]
+
+  if should_succeed:
+    txn_result = send_nft_auction_transaction("claimNFTsWithLimit", args=txn_args, signer=signer)
+    assert txn_result
+    print("Successfuly Claimed Owed NFTs")
+    return txn_result
+  else:
+    assert not send_nft_auction_transaction("claimNFTsWithLimit", args=txn_args, signer=signer)
+    print("Failed to Claim Owed NFTs as Expected")
+
+def get_nft_claim_count(nft_type_identifier, entity):
+  args = [["String", nft_type_identifier], ["Address", address(entity)]]
+  return send_nft_auction_script_and_return_decoded_result("getNftClaimCount", args=args)
+
+@pytest.mark.core
+def test_claim_nfts_with_limit():
+  # Deploy contracts
+  main()
+
+  setup_async_resources("User1")
+  setup_async_resources("User2")
+  transfer_flow_token("User2", "100.0", "emulator-account")
+
+  nft_type = "A.01cf0e2f2f715450.AsyncArtwork.NFT"
+  claimed_event = f'A.{address("NFTAuction")[2:]}.NFTAuction.NFTsClaimed'
+
+  # User2 wins three auctions
+  for token_id in ["1", "2", "3"]:
+    whitelist(["User1", token_id, "0", "0.01"], "AsyncArtAccount", True)
+    mint_master_token([token_id, "<uri>", [], []], "User1", True)
+    create_new_nft_auction(
+      [nft_type, token_id, "A.0ae53cb6e3f42a79.FlowToken.Vault", "2.0", "5.0", "0.00000001", "5.0", ["AsyncArtAccount"], ["0.05"]],
+      "User1",
+      True
+    )
+    make_bid([nft_type, token_id, "A.0ae53cb6e3f42a79.FlowToken.Vault", "4.0"], "User2", True)
+
+  # Settling while User2's receiver is unlinked leaves all three NFTs owed to User2
+  send_async_artwork_transaction("unlinkAsyncArtworkNFTCollectionPublicCapability", signer="User2")
+  for token_id in ["1", "2", "3"]:
+    advance_past_auction_end(nft_type, token_id)
+    settle_auction([nft_type, token_id], "User1", True)
+  send_async_artwork_transaction("linkAsyncArtworkNFTCollectionPublicCapability", signer="User2")
+  assert get_nft_claim_count(nft_type, "User2") == 3
+
+  # A limit of zero and accounts without claims are rejected
+  claim_nfts_with_limit([nft_type, "0"], "User2", False)
+  claim_nfts_with_limit([nft_type, "1"], "User1", False)
+
+  # A limited claim leaves the rest owed
+  txn_result = claim_nfts_with_limit([nft_type, "2"], "User2", True)
+  assert txn_result.has_event(claimed_event, count=2, remaining=1)
+  assert get_nft_claim_count(nft_type, "User2") == 1
+
+  # The drainer claims whatever is left
+  assert drain_nft_claims(nft_type, "User2") == 1
+  assert get_nft_claim_count(nft_type, "User2") == 0
+  assert drain_nft_claims(nft_type, "User2") == 0
+  claim_nfts_with_limit([nft_type, "1"], "User2", False)
+
+if __name__ == '__main__':
+  test_claim_nfts_with_limit()
@@ -1,7 +1,6 @@
 from initialize_testing_environment import main
 from transaction_handler import send_transaction, send_nft_auction_transaction
 from script_handler import send_script, send_script_and_return_result, send_async_artwork_script_and_return_result
-from event_handler import check_for_event
 from utils import address, transfer_flow_token
 import pytest
 
@@ -1,7 +1,6 @@
 from initialize_testing_environment import main
 from transaction_handler import send_nft_auction_transaction
 from script_handler import send_nft_auction_script_and_return_result
-from event_handler import check_for_event
 from utils import address
 import pytest
 
@@ -17,9 +16,10 @@ def create_new_sale(args, signer, should_succeed, expected_auction_result=None):
   auction_args = [["String", args[0]], ["UInt64", args[1]], ["String", args[2]], ["UFix64", args[3]], ["Address", args[4]], ["Array", fee_recipients], ["Array", fee_percentages]]
 
   if should_succeed:
-    assert send_nft_auction_transaction("createArtSale", args=auction_args, signer=signer)
+    txn_result = send_nft_auction_transaction("createArtSale", args=auction_args, signer=signer)
+    assert txn_result
     event = f'A.{address("NFTAuction")[2:]}.NFTAuction.SaleCreated'
-    assert check_for_event(event)
+    assert txn_result.has_event(event)
     auction_result = send_nft_auction_script_and_return_result("getAuction", args=[["String", args[0]], ["UInt64", args[1]]])
     print(auction_result)
     if expected_auction_result != None:
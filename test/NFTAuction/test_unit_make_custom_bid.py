@@ -1,7 +1,6 @@
 from initialize_testing_environment import main
 from transaction_handler import send_transaction, send_nft_auction_transaction
 from script_handler import send_script, send_script_and_return_result, send_async_artwork_script_and_return_result, send_nft_auction_script_and_return_result
-from event_handler import check_for_event
 from utils import address, transfer_flow_token
 import pytest
 
@@ -16,9 +15,10 @@ def make_custom_bid(args, signer, should_succeed, expected_result=None):
   txn_args = [["String", args[0]], ["UInt64", args[1]], ["String", args[2]], ["UFix64", args[3]], ["Address", args[4]]]
 
   if should_succeed:
-    assert send_nft_auction_transaction("makeCustomBid", args=txn_args, signer=signer)
+    txn_result = send_nft_auction_transaction("makeCustomBid", args=txn_args, signer=signer)
+    assert txn_result
     event = f'A.{address("NFTAuction")[2:]}.NFTAuction.BidMade'
-    assert check_for_event(event)
+    assert txn_result.has_event(event)
     result = send_nft_auction_script_and_return_result("getAuction", args=[["String", args[0]], ["UInt64", args[1]]])
     print(result)
     if expected_result != None:
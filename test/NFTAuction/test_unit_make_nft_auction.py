@@ -1,7 +1,6 @@
 from initialize_testing_environment import main
 from transaction_handler import send_nft_auction_transaction
 from script_handler import send_nft_auction_script_and_return_result
-from event_handler import check_for_event
 from utils import address, minimal_address
 import pytest
 
@@ -17,9 +16,10 @@ def create_new_nft_auction(args, signer, should_succeed, expected_auction_result
   auction_args = [["String", args[0]], ["UInt64", args[1]], ["String", args[2]], ["UFix64", args[3]], ["UFix64", args[4]], ["UFix64", args[5]], ["UFix64", args[6]], ["Array", fee_recipients], ["Array", fee_percentages]]
 
   if should_succeed:
-    assert send_nft_auction_transaction("createNewArtAuction", args=auction_args, signer=signer)
+    txn_result = send_nft_auction_transaction("createNewArtAuction", args=auction_args, signer=signer)
+    assert txn_result
     event = f'A.{address("NFTAuction")[2:]}.NFTAuction.NftAuctionCreated'
-    assert check_for_event(event)
+    assert txn_result.has_event(event)
     auction_result = send_nft_auction_script_and_return_result("getAuction", args=[["String", args[0]], ["UInt64", args[1]]])
     if expected_auction_result != None:
       assert expected_auction_result == auction_result
@@ -1,7 +1,7 @@
 from initialize_testing_environment import main
-from transaction_handler import send_transaction, send_nft_auction_transaction
+from transaction_handler import send_nft_auction_transaction
 from script_handler import send_script, send_script_and_return_result, send_async_artwork_script_and_return_result, send_nft_auction_script_and_return_result
-from event_handler import check_for_event
+from time_control import advance_past_auction_end
 from utils import address, minimal_address, transfer_flow_token
 import pytest
 
@@ -18,9 +18,10 @@ def settle_auction(args, signer, should_succeed, expected_result=None):
   txn_args = [["String", args[0]], ["UInt64", args[1]]]
 
   if should_succeed:
-    assert send_nft_auction_transaction("settleAuction", args=txn_args, signer=signer)
+    txn_result = send_nft_auction_transaction("settleAuction", args=txn_args, signer=signer)
+    assert txn_result
     event = f'A.{address("NFTAuction")[2:]}.NFTAuction.AuctionSettled'
-    assert check_for_event(event)
+    assert txn_result.has_event(event)
     result = send_nft_auction_script_and_return_result("getAuction", args=[["String", args[0]], ["UInt64", args[1]]])
     print(result)
     if expected_result != None:
@@ -88,8 +89,7 @@ def test_settle_auction():
     True
   )
 
-  for i in range(120):
-    send_transaction("simulateTimeDelay")
+  advance_past_auction_end("A.01cf0e2f2f715450.AsyncArtwork.NFT", "1")
 
   # Cannot settle auction that does not exist
   settle_auction(
@@ -132,8 +132,7 @@ def test_settle_auction():
     True
   )
 
-  for i in range(120):
-    send_transaction("simulateTimeDelay")
+  advance_past_auction_end("A.01cf0e2f2f715450.AsyncArtwork.NFT", "1")
 
   # Can settle auction as non NFT seller, and as non bidder
   settle_auction(
@@ -0,0 +1,78 @@
+from initialize_testing_environment import main
+from transaction_handler import send_nft_auction_transaction
+from script_handler import send_script_and_return_result, send_async_artwork_script_and_return_result
+from time_control import advance_past_auction_end
+from utils import address, transfer_flow_token
+import pytest
+
+from test_unit_setup_async_resources import setup_async_resources
+from test_unit_whitelist import whitelist
+from test_unit_mint_master_token import mint_master_token
+from test_unit_make_nft_auction import create_new_nft_auction
+from test_unit_make_bid import make_bid
+
+# expected args: [nftTypeIdentifiers, tokenIds]
+
+# Returns whether each auction was settled, from the AuctionSettled events of the transaction
+def settle_auctions(args, signer, should_succeed):
+  txn_args = [["Array", [["String", nft_type] for nft_type in args[0]]], ["Array", [["UInt64", token_id] for token_id in args[1]]]]
+
+  if should_succeed:
+    txn_result = send_nft_auction_transaction("settleAuctions", args=txn_args, signer=signer)
+    assert txn_result
+    event = f'A.{address("NFTAuction")[2:]}.NFTAuction.AuctionSettled'
+    settled = {(e.get("nftTypeIdentifier"), e.get("tokenId")) for e in txn_result.events_of(event)}
+    print("Successfully Sent Auction Settlements")
+    return [(nft_type, int(token_id)) in settled for nft_type, token_id in zip(args[0], args[1])]
+  else:
+    assert not send_nft_auction_transaction("settleAuctions", args=txn_args, signer=signer)
+    print("Failed to Settle Auctions as Expected")
+
+@pytest.mark.core
+def test_settle_auctions():
+  # Deploy contracts
+  main()
+
+  setup_async_resources("User1")
+  setup_async_resources("User2")
+  setup_async_resources("User3")
+  transfer_flow_token("User2", "100.0", "emulator-account")
+
+  nft_type = "A.01cf0e2f2f715450.AsyncArtwork.NFT"
+
+  for token_id in ["1", "2", "3"]:
+    whitelist(["User1", token_id, "0", "0.01"], "AsyncArtAccount", True)
+    mint_master_token([token_id, "<uri>", [], []], "User1", True)
+    create_new_nft_auction(
+      [nft_type, token_id, "A.0ae53cb6e3f42a79.FlowToken.Vault", "2.0", "5.0", "0.00000001", "5.0", ["AsyncArtAccount"], ["0.05"]],
+      "User1",
+      True
+    )
+
+  # Auctions 1 and 2 get bids, auction 3 does not
+  make_bid([nft_type, "1", "A.0ae53cb6e3f42a79.FlowToken.Vault", "4.0"], "User2", True)
+  make_bid([nft_type, "2", "A.0ae53cb6e3f42a79.FlowToken.Vault", "4.0"], "User2", True)
+
+  # Nothing has ended yet, every auction is skipped
+  assert settle_auctions([[nft_type] * 3, ["1", "2", "3"]], "User3", True) == [False, False, False]
+
+  advance_past_auction_end(nft_type, "1")
+  advance_past_auction_end(nft_type, "2")
+
+  # Anyone can settle, the auction without bids does not sink the batch
+  assert settle_auctions([[nft_type] * 3, ["1", "3", "2"]], "User3", True) == [True, False, True]
+
+  # The seller is paid for both auctions, less fees
+  assert "7.60000000" == send_script_and_return_result("getUsersFlowTokenBalance", args=[["Address", address("User1")]])
+  assert "92.00000000" == send_script_and_return_result("getUsersFlowTokenBalance", args=[["Address", address("User2")]])
+  user2_owned_nfts = send_async_artwork_script_and_return_result("getNFTs", args=[["Address", address("User2")]])
+  assert "id: 1" in user2_owned_nfts and "id: 2" in user2_owned_nfts
+
+  # Settled auctions are skipped, unknown types and ids too
+  assert settle_auctions([[nft_type, nft_type, "A.01cf0e2f2f715450.AsyncArtwork.NF"], ["1", "4", "2"]], "User3", True) == [False, False, False]
+
+  # Type identifiers and token ids must pair up
+  settle_auctions([[nft_type], ["1", "3"]], "User3", False)
+
+if __name__ == '__main__':
+  test_settle_auctions()
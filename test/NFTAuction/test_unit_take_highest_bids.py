@@ -0,0 +1,80 @@
+from initialize_testing_environment import main
+from transaction_handler import send_nft_auction_transaction
+from script_handler import send_script_and_return_result, send_async_artwork_script_and_return_result
+from utils import address, transfer_flow_token
+import pytest
+
+from test_unit_setup_async_resources import setup_async_resources
+from test_unit_whitelist import whitelist
+from test_unit_mint_master_token import mint_master_token
+from test_unit_make_nft_auction import create_new_nft_auction
+from test_unit_make_bid import make_bid
+from test_unit_transfer_nft import transfer_nft
+
+# expected args: [nftTypeIdentifiers, tokenIds]
+
+# Returns whether each highest bid was taken, from the HighestBidTaken events of the transaction
+def take_highest_bids(args, signer, should_succeed):
+  txn_args = [["Array", [["String", nft_type] for nft_type in args[0]]], ["Array", [["UInt64", token_id] for token_id in args[1]]]]
+
+  if should_succeed:
+    txn_result = send_nft_auction_transaction("takeHighestBids", args=txn_args, signer=signer)
+    assert txn_result
+    event = f'A.{address("NFTAuction")[2:]}.NFTAuction.HighestBidTaken'
+    taken = {(e.get("nftTypeIdentifier"), e.get("tokenId")) for e in txn_result.events_of(event)}
+    print("Successfully Sent Highest Bid Acceptances")
+    return [(nft_type, int(token_id)) in taken for nft_type, token_id in zip(args[0], args[1])]
+  else:
+    assert not send_nft_auction_transaction("takeHighestBids", args=txn_args, signer=signer)
+    print("Failed to Accept Highest Bids as Expected")
+
+@pytest.mark.core
+def test_take_highest_bids():
+  # Deploy contracts
+  main()
+
+  setup_async_resources("User1")
+  setup_async_resources("User2")
+  setup_async_resources("User3")
+  transfer_flow_token("User2", "100.0", "emulator-account")
+
+  nft_type = "A.01cf0e2f2f715450.AsyncArtwork.NFT"
+
+  for token_id in ["1", "2", "3", "4"]:
+    whitelist(["User1", token_id, "0", "0.01"], "AsyncArtAccount", True)
+    mint_master_token([token_id, "<uri>", [], []], "User1", True)
+    create_new_nft_auction(
+      [nft_type, token_id, "A.0ae53cb6e3f42a79.FlowToken.Vault", "2.0", "5.0", "86400.0", "5.0", ["AsyncArtAccount"], ["0.05"]],
+      "User1",
+      True
+    )
+
+  # Auction 1 gets a bid above the minimum price, auctions 2 and 4 early bids below it, auction 3 none
+  make_bid([nft_type, "1", "A.0ae53cb6e3f42a79.FlowToken.Vault", "4.0"], "User2", True)
+  make_bid([nft_type, "2", "A.0ae53cb6e3f42a79.FlowToken.Vault", "1.0"], "User2", True)
+  make_bid([nft_type, "4", "A.0ae53cb6e3f42a79.FlowToken.Vault", "1.0"], "User2", True)
+
+  # Below the minimum price the NFT stays with the seller, who gives token 4 away while its auction is open
+  transfer_nft(["4", "User3"], "User1", True)
+
+  # Only the seller can take the bids
+  assert take_highest_bids([[nft_type] * 4, ["1", "4", "2", "3"]], "User2", True) == [False, False, False, False]
+
+  # The auction without bids and the NFT the seller no longer holds do not sink the batch,
+  # bids below the minimum price can still be taken
+  assert take_highest_bids([[nft_type] * 4, ["1", "4", "2", "3"]], "User1", True) == [True, False, True, False]
+
+  assert "4.75000000" == send_script_and_return_result("getUsersFlowTokenBalance", args=[["Address", address("User1")]])
+  assert "94.00000000" == send_script_and_return_result("getUsersFlowTokenBalance", args=[["Address", address("User2")]])
+  user2_owned_nfts = send_async_artwork_script_and_return_result("getNFTs", args=[["Address", address("User2")]])
+  assert "id: 1" in user2_owned_nfts and "id: 2" in user2_owned_nfts and "id: 4" not in user2_owned_nfts
+  assert send_async_artwork_script_and_return_result("getNFT", args=[["Address", address("User3")], ["UInt64", "4"]])
+
+  # Taken bids cannot be taken again
+  assert take_highest_bids([[nft_type, nft_type], ["1", "2"]], "User1", True) == [False, False]
+
+  # Type identifiers and token ids must pair up
+  take_highest_bids([[nft_type], ["1", "3"]], "User1", False)
+
+if __name__ == '__main__':
+  test_take_highest_bids()
@@ -1,7 +1,6 @@
 from initialize_testing_environment import main
 from transaction_handler import send_async_artwork_transaction, send_transaction
 from script_handler import send_async_artwork_script_and_return_result, send_script_and_return_result
-from event_handler import check_for_event
 from metadata_handler import result_equals_expected_metadata
 from utils import address
 import json
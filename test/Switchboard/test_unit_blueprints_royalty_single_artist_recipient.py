@@ -1,7 +1,6 @@
 from initialize_testing_environment import main
 from transaction_handler import send_blueprints_transaction, send_transaction
 from script_handler import send_blueprints_script_and_return_result, send_script_and_return_result
-from event_handler import check_for_event, check_for_n_event_occurences_over_x_blocks
 from utils import address, transfer_flow_token
 import pytest
 
@@ -0,0 +1,90 @@
+from initialize_testing_environment import main
+from transaction_handler import send_async_artwork_transaction, send_nft_auction_transaction
+from async_transaction_handler import send_async_artwork_transaction_async, send_nft_auction_transaction_async, run_transactions
+from account_provisioning import add_proposal_keys
+from flow_client import BACKEND
+from time_control import SETTLEMENT_GRACE_PERIOD, advance_time
+from benchmark import ENABLED, benchmark_size
+from utils import address, transfer_flow_token
+import pytest
+
+from test_unit_setup_async_resources import setup_async_resources
+from test_unit_whitelist import whitelist
+from test_unit_mint_master_token import mint_master_token
+
+# Settles many auctions won by one bidder whose NFT receiver is unlinked, so every settlement adds
+# to the same recipient's NFT claims. Settlements are recorded by the number of claims already
+# pending (in buckets of SIZE_BUCKET), a flat computation curve means adding a claim is constant cost.
+
+pytestmark = [
+  pytest.mark.benchmark,
+  pytest.mark.skipif(not ENABLED, reason="set FLOW_BENCHMARK=1 to run benchmarks")
+]
+
+BENCHMARK_GAS_LIMIT = 9999
+
+AUCTION_COUNT = 1000
+# Tokens are minted as master tokens with this many control tokens each
+LAYERS_PER_MASTER = 99
+SIZE_BUCKET = 100
+CONCURRENCY = 16
+
+FLOW_TOKEN = "A.0ae53cb6e3f42a79.FlowToken.Vault"
+
+def mint_tokens(count):
+  token_ids = []
+  master_id = 1
+  while len(token_ids) < count:
+    layers = min(LAYERS_PER_MASTER, count - len(token_ids) - 1)
+    whitelist(["User1", str(master_id), str(layers), "0.01"], "AsyncArtAccount", True)
+    mint_master_token([str(master_id), "<uri>", ["User1"] * layers, []], "User1", True)
+    control_ids = range(master_id + 1, master_id + layers + 1)
+    results = run_transactions(*(
+      send_async_artwork_transaction_async("mintControlToken", args=[
+        ["UInt64", str(token_id)], ["String", "<uri>"], ["Array", []], ["Array", []], ["Array", []], ["Int64", "1"], ["Array", []]
+      ], signer="User1")
+      for token_id in control_ids
+    ), limit=CONCURRENCY)
+    assert all(results)
+    token_ids += [master_id] + list(control_ids)
+    master_id += layers + 1
+  return token_ids
+
+def test_benchmark_settle_auctions_to_unlinked_receiver():
+  main()
+
+  setup_async_resources("User1")
+  setup_async_resources("User2")
+  transfer_flow_token("User2", str(4.0 * AUCTION_COUNT + 10.0), "emulator-account")
+  if BACKEND == "client":
+    add_proposal_keys("User1", CONCURRENCY)
+    add_proposal_keys("User2", CONCURRENCY)
+
+  nft_type = f'A.{address("AsyncArtwork")[2:]}.AsyncArtwork.NFT'
+  token_ids = mint_tokens(AUCTION_COUNT)
+
+  results = run_transactions(*(
+    send_nft_auction_transaction_async("createNewArtAuction", args=[
+      ["String", nft_type], ["UInt64", str(token_id)], ["String", FLOW_TOKEN], ["UFix64", "2.0"], ["UFix64", "5.0"],
+      ["UFix64", "0.00000001"], ["UFix64", "0.1"], ["Array", [["Address", address("AsyncArtAccount")]]], ["Array", [["UFix64", "0.05"]]]
+    ], signer="User1")
+    for token_id in token_ids
+  ), limit=CONCURRENCY)
+  assert all(results)
+
+  results = run_transactions(*(
+    send_nft_auction_transaction_async("makeBid", args=[
+      ["String", nft_type], ["UInt64", str(token_id)], ["String", FLOW_TOKEN], ["UFix64", "4.0"]
+    ], signer="User2")
+    for token_id in token_ids
+  ), limit=CONCURRENCY)
+  assert all(results)
+
+  # The winner can no longer receive the NFTs, each settlement sends one to the claims
+  assert send_async_artwork_transaction("unlinkAsyncArtworkNFTCollectionPublicCapability", signer="User2")
+  advance_time(SETTLEMENT_GRACE_PERIOD + 1)
+
+  for pending_claims, token_id in enumerate(token_ids):
+    with benchmark_size(pending_claims // SIZE_BUCKET * SIZE_BUCKET):
+      result = send_nft_auction_transaction("settleAuction", args=[["String", nft_type], ["UInt64", str(token_id)]], signer="User1", gas_limit=BENCHMARK_GAS_LIMIT)
+    assert result, result
@@ -0,0 +1,126 @@
+from initialize_testing_environment import main
+from transaction_handler import send_async_artwork_transaction, send_nft_auction_transaction, send_blueprints_transaction
+from script_handler import send_script_and_return_decoded_result
+from benchmark import ENABLED, benchmark_size, record_storage
+from utils import address, transfer_flow_token
+import pytest
+
+from test_unit_setup_async_resources import setup_async_resources
+from test_unit_whitelist import whitelist
+from test_unit_mint_master_token import mint_master_token
+from test_unit_prepare_blueprint import prepare_blueprint
+from test_unit_begin_sale import begin_sale
+
+# Computation cost sweeps over the inputs that grow in production. Run with
+# FLOW_BENCHMARK=1 pytest -m benchmark, see test/benchmark.py for history and baselines.
+
+pytestmark = [
+  pytest.mark.benchmark,
+  pytest.mark.skipif(not ENABLED, reason="set FLOW_BENCHMARK=1 to run benchmarks")
+]
+
+# The emulator's maximum, so the sweeps measure cost instead of hitting the default limit
+BENCHMARK_GAS_LIMIT = 9999
+
+LEVER_COUNTS = [1, 10, 100, 250, 500, 1000]
+# mintControlToken rejects more levers than this
+MAX_LEVERS = 500
+FEE_RECIPIENT_COUNTS = [1, 5, 10, 25, 50]
+PURCHASE_QUANTITIES = [1, 10, 25, 50, 100]
+
+FLOW_TOKEN = "A.0ae53cb6e3f42a79.FlowToken.Vault"
+
+def storage_used(entity):
+  return send_script_and_return_decoded_result("getStorageUsed", args=[["Address", address(entity)]])
+
+# Token metadata lives in the AsyncArtwork contract account, so its storage growth around a mint is
+# what a token's levers cost. Every lever is then updated once.
+def test_benchmark_mint_control_token_levers():
+  main()
+
+  setup_async_resources("User1")
+  setup_async_resources("User2")
+
+  # One master token whose layers are all control tokens for User2, one per lever count
+  whitelist(["User1", "1", str(len(LEVER_COUNTS)), "0.01"], "AsyncArtAccount", True)
+  mint_master_token(["1", "<uri>", ["User2"] * len(LEVER_COUNTS), []], "User1", True)
+
+  for i, levers in enumerate(LEVER_COUNTS):
+    mint_args = [
+      ["UInt64", str(2 + i)],
+      ["String", "<uri>"],
+      ["Array", [["Int64", "1"]] * levers],
+      ["Array", [["Int64", "100"]] * levers],
+      ["Array", [["Int64", "50"]] * levers],
+      ["Int64", "5"],
+      ["Array", []]
+    ]
+    with benchmark_size(levers):
+      storage_before = storage_used("AsyncArtwork")
+      result = send_async_artwork_transaction("mintControlToken", args=mint_args, signer="User2", gas_limit=BENCHMARK_GAS_LIMIT)
+      print(result)
+      assert bool(result) == (levers <= MAX_LEVERS)
+      if not result:
+        continue
+      record_storage("AsyncArtwork/mintControlToken", storage_used("AsyncArtwork") - storage_before)
+
+      use_args = [
+        ["UInt64", str(2 + i)],
+        ["Array", [["UInt64", str(lever_id)] for lever_id in range(levers)]],
+        ["Array", [["Int64", "51"]] * levers],
+        ["UFix64", "0.0"]
+      ]
+      result = send_async_artwork_transaction("useControlToken", args=use_args, signer="User2", gas_limit=BENCHMARK_GAS_LIMIT)
+      print(result)
+      assert result
+
+def test_benchmark_create_new_art_auction_fee_recipients():
+  main()
+
+  setup_async_resources("User1")
+  setup_async_resources("User2")
+  setup_async_resources("User3")
+
+  recipients = ["AsyncArtAccount", "User2", "User3"]
+  nft_type = f'A.{address("AsyncArtwork")[2:]}.AsyncArtwork.NFT'
+
+  for token_id, count in enumerate(FEE_RECIPIENT_COUNTS, start=1):
+    whitelist(["User1", str(token_id), "0", "0.01"], "AsyncArtAccount", True)
+    mint_master_token([str(token_id), "<uri>", [], []], "User1", True)
+
+    fee_recipients = [["Address", address(recipients[i % len(recipients)])] for i in range(count)]
+    fee_percentages = [["UFix64", "0.01"]] * count
+    auction_args = [
+      ["String", nft_type], ["UInt64", str(token_id)], ["String", FLOW_TOKEN], ["UFix64", "2.0"], ["UFix64", "5.0"],
+      ["UFix64", "86400.0"], ["UFix64", "0.1"], ["Array", fee_recipients], ["Array", fee_percentages]
+    ]
+    with benchmark_size(count):
+      result = send_nft_auction_transaction("createNewArtAuction", args=auction_args, signer="User1", gas_limit=BENCHMARK_GAS_LIMIT)
+    print(result)
+    assert result
+
+def purchase_blueprints_sweep(txname):
+  main()
+
+  transfer_flow_token("User2", str(float(sum(PURCHASE_QUANTITIES))), "emulator-account")
+  setup_async_resources("User2")
+
+  for blueprint_id, quantity in enumerate(PURCHASE_QUANTITIES):
+    prepare_blueprint(
+      ["User1", str(quantity), "1.0", FLOW_TOKEN, "metadata", "https://token-uri.com", [], "0", "0", str(quantity)],
+      "AsyncArtAccount",
+      True
+    )
+    begin_sale(str(blueprint_id), "AsyncArtAccount", True)
+
+    purchase_args = [["UInt64", str(blueprint_id)], ["UInt64", str(quantity)], ["Address", address("User2")]]
+    with benchmark_size(quantity):
+      result = send_blueprints_transaction(txname, args=purchase_args, signer="User2", gas_limit=BENCHMARK_GAS_LIMIT)
+    print(result)
+    assert result
+
+def test_benchmark_purchase_blueprints_quantity():
+  purchase_blueprints_sweep("purchaseBlueprints")
+
+def test_benchmark_purchase_blueprints_batched_quantity():
+  purchase_blueprints_sweep("purchaseBlueprintsBatched")
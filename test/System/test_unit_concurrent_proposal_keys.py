@@ -0,0 +1,39 @@
+from initialize_testing_environment import main
+from async_transaction_handler import send_transaction_async, run_transactions
+from account_provisioning import add_proposal_keys
+from flow_client import BACKEND
+from script_handler import send_script_and_return_result
+from utils import address, transfer_flow_token
+from decimal import Decimal
+import pytest
+
+# More transactions than proposal keys in flight from one signer, so several of them share a key
+# at once and have to reach the emulator in sequence number order
+
+KEY_COUNT = 2
+TRANSACTION_COUNT = 12
+
+def flow_token_balance(entity):
+  return Decimal(send_script_and_return_result("getUsersFlowTokenBalance", args=[["Address", address(entity)]]))
+
+@pytest.mark.core
+@pytest.mark.skipif(BACKEND != "client", reason="only the client backend rotates over proposal keys, set FLOW_BACKEND=client")
+def test_concurrent_transactions_share_proposal_keys():
+  # Deploy contracts
+  main()
+
+  transfer_flow_token("User1", "100.0", "emulator-account")
+  assert add_proposal_keys("User1", KEY_COUNT).size == KEY_COUNT
+  balance = flow_token_balance("User2")
+
+  results = run_transactions(*(
+    send_transaction_async("transferFlowToken", args=[["Address", address("User2")], ["UFix64", "1.0"]], signer="User1")
+    for _ in range(TRANSACTION_COUNT)
+  ), limit=TRANSACTION_COUNT)
+
+  # Every transaction sealed, none was rejected for its sequence number
+  assert all(results), [result.error_message for result in results if not result]
+  assert flow_token_balance("User2") == balance + TRANSACTION_COUNT
+
+if __name__ == '__main__':
+  test_concurrent_transactions_share_proposal_keys()
@@ -0,0 +1,38 @@
+from initialize_testing_environment import USE_SNAPSHOTS, main, create_snapshot, load_snapshot
+from script_handler import send_script_and_return_result
+from utils import address, transfer_flow_token
+from decimal import Decimal
+import pytest
+
+# Restoring a snapshot rolls back every change made since it was taken, and transactions keep
+# working afterwards even though the signers' sequence numbers went back with it
+
+def flow_token_balance(entity):
+  return Decimal(send_script_and_return_result("getUsersFlowTokenBalance", args=[["Address", address(entity)]]))
+
+@pytest.mark.core
+@pytest.mark.skipif(not USE_SNAPSHOTS, reason="the emulator only takes snapshots with FLOW_SNAPSHOTS=1")
+def test_load_snapshot_restores_state():
+  # Deploy contracts
+  main()
+
+  balance = flow_token_balance("User1")
+  create_snapshot("test-restore")
+
+  transfer_flow_token("User1", "10.0", "emulator-account")
+  transfer_flow_token("User1", "5.0", "emulator-account")
+  assert flow_token_balance("User1") == balance + 15
+
+  load_snapshot("test-restore")
+  assert flow_token_balance("User1") == balance
+
+  # The emulator account's sequence number is back where it was, the next transaction still seals
+  transfer_flow_token("User1", "1.0", "emulator-account")
+  assert flow_token_balance("User1") == balance + 1
+
+  # main() restores the deployed baseline over the test's own snapshot
+  main()
+  assert flow_token_balance("User1") == balance
+
+if __name__ == '__main__':
+  test_load_snapshot_restores_state()
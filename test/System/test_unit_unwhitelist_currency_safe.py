@@ -1,7 +1,6 @@
 from initialize_testing_environment import main
 from transaction_handler import send_blueprints_transaction, send_transaction
 from script_handler import send_blueprints_script_and_return_result
-from event_handler import check_for_event
 from utils import address
 import pytest
 
@@ -17,9 +16,10 @@ def unwhitelist_currency_safe(arg, signer, should_succeed):
   formatted_args = [["String", arg]]
 
   if should_succeed:
-    assert send_transaction("unwhitelistCurrencySafe", args=formatted_args, signer=signer)
+    txn_result = send_transaction("unwhitelistCurrencySafe", args=formatted_args, signer=signer)
+    assert txn_result
     event = f'A.{address("AsyncArtwork")[2:]}.Blueprints.CurrencyUnwhitelisted'
-    assert check_for_event(event)
+    assert txn_result.has_event(event)
     print("Successfully Unwhitelisted Currency")
   else:
     assert not send_transaction("unwhitelistCurrencySafe", args=formatted_args, signer=signer)
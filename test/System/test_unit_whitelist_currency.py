@@ -1,7 +1,6 @@
 from initialize_testing_environment import main
 from transaction_handler import send_blueprints_transaction, send_transaction
 from script_handler import send_blueprints_script_and_return_result
-from event_handler import check_for_event
 from utils import address
 import pytest
 
@@ -14,9 +13,10 @@ from test_unit_update_blueprint_settings import update_blueprint_settings
 
 def whitelist_example_token(signer, should_succeed):
   if should_succeed:
-    assert send_transaction("whitelistExampleToken", signer=signer)
+    txn_result = send_transaction("whitelistExampleToken", signer=signer)
+    assert txn_result
     event = f'A.{address("AsyncArtwork")[2:]}.Blueprints.CurrencyWhitelisted'
-    assert check_for_event(event)
+    assert txn_result.has_event(event)
     print("Successfully Whitelisted Example Token")
   else:
     assert not send_transaction("whitelistExampleToken", signer=signer)
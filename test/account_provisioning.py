@@ -0,0 +1,102 @@
+import base64
+import json
+
+from cadence_json import decode_value
+from emulator_pool import current_emulator
+from flow_client import FlowClientError, get_client, key_pool_for, load_flow_config, public_key_for
+from flow_crypto import generate_key_pair
+from proposal_keys import register_key_pool
+
+# Bulk account creation through the in-process client. Keys are generated locally (ECDSA
+# P-256) instead of via `flow keys generate`, accounts are created many per transaction by
+# createAccounts.cdc, and every chunk is submitted before any of them is awaited.
+
+CREATE_ACCOUNTS_TRANSACTION = "cadence/transactions/createAccounts.cdc"
+ADD_PROPOSAL_KEYS_TRANSACTION = "cadence/transactions/addProposalKeys.cdc"
+ACCOUNTS_PER_TRANSACTION = 50
+ACCOUNT_CREATION_GAS_LIMIT = 9999
+
+def created_addresses(result):
+    addresses = []
+    for event in result['events']:
+        if event['type'] == "flow.AccountCreated":
+            fields = decode_value(json.loads(base64.b64decode(event['payload'])))
+            addresses.append("0x" + format(fields.address, "016x"))
+    return addresses
+
+def create_accounts(count, payer="emulator-account"):
+    keys = [generate_key_pair() for _ in range(count)]
+    accounts, _ = load_flow_config()
+    signer = accounts[payer]
+    client = get_client()
+    with open(CREATE_ACCOUNTS_TRANSACTION, "r") as f:
+        code = f.read()
+
+    # The payer proposes every chunk, so sequence numbers are assigned locally by its key pool
+    # rather than fetched per transaction, which lets all chunks be in flight at once
+    pool = key_pool_for(signer)
+    tx_ids = []
+    for start in range(0, count, ACCOUNTS_PER_TRANSACTION):
+        public_keys = [{"type": "String", "value": public_key} for _, public_key in keys[start:start + ACCOUNTS_PER_TRANSACTION]]
+        key_index, sequence_number = pool.acquire(client)
+        transaction = client.build_transaction(
+            code,
+            [{"type": "Array", "value": public_keys}],
+            signer,
+            key_index,
+            sequence_number,
+            gas_limit=ACCOUNT_CREATION_GAS_LIMIT
+        )
+        tx_ids.append(client.submit_transaction(transaction))
+
+    addresses = []
+    for tx_id in tx_ids:
+        result = client.wait_for_seal(tx_id)
+        if result['error_message']:
+            raise FlowClientError(f"Account creation transaction {tx_id} failed: {result['error_message']}")
+        addresses.extend(created_addresses(result))
+    if len(addresses) != count:
+        raise FlowClientError(f"Expected {count} created accounts, found {len(addresses)}")
+
+    return [{'address': address, 'key': private_key} for address, (private_key, _) in zip(addresses, keys)]
+
+def provision_accounts(names, payer="emulator-account"):
+    return dict(zip(names, create_accounts(len(names), payer)))
+
+# Creates `count` extra users named <prefix>1..<prefix>N and registers them in the flow
+# config, so they work with address() and as signers like User1-User4
+def provision_synthetic_users(count, prefix="LoadUser", payer="emulator-account"):
+    names = [f"{prefix}{i}" for i in range(1, count + 1)]
+    created = provision_accounts(names, payer)
+    config_path = current_emulator().config_path
+    with open(config_path, "r") as f:
+        flow_json = json.load(f)
+    flow_json['accounts'].update(created)
+    with open(config_path, "w") as f:
+        f.write(json.dumps(flow_json, indent=4))
+    return names
+
+# Gives `signer` `count` proposal keys (copies of its flow.json key, so nothing else has to
+# change) and registers them, after which the in-process client rotates over all of them
+def add_proposal_keys(signer_name, count):
+    accounts, _ = load_flow_config()
+    signer = accounts[signer_name]
+    public_key = public_key_for(signer['key'])
+    client = get_client()
+
+    keys = client.request("GET", f"/v1/accounts/{signer['address']}?expand=keys")['keys']
+    matching = [k for k in keys if not k['revoked'] and k['public_key'].lower().endswith(public_key)]
+    if len(matching) < count:
+        with open(ADD_PROPOSAL_KEYS_TRANSACTION, "r") as f:
+            code = f.read()
+        result = client.send_transaction(
+            code,
+            [{"type": "String", "value": public_key}, {"type": "Int", "value": str(count - len(matching))}],
+            signer
+        )
+        if result['error_message']:
+            raise FlowClientError(f"Adding proposal keys failed: {result['error_message']}")
+
+    pool = register_key_pool(signer['address'], public_key, range(len(keys) + count))
+    pool.resync(client)
+    return pool
@@ -0,0 +1,122 @@
+import asyncio
+import threading
+import time
+import weakref
+from subprocess import CalledProcessError, PIPE
+
+from flow_client import BACKEND, SEAL_POLL_INTERVAL, SEAL_TIMEOUT, FlowClient, FlowClientError, key_pool_for, prepare_transaction_file
+from proposal_keys import is_sequence_number_mismatch
+from transaction_handler import construct_arg_list, transaction_command, transaction_result_from_access_api
+from transaction_result import from_cli_output
+
+# asyncio variants of the transaction_handler helpers. Each coroutine submits its transaction
+# as soon as it is scheduled and resolves to its TransactionResult (like the blocking helpers) once the
+# transaction is sealed, so independent steps can be in flight together:
+#
+#   await gather_transactions(
+#     send_transaction_async("setupAsyncResources", signer="User1"),
+#     send_transaction_async("setupAsyncResources", signer="User2"),
+#     limit=4
+#   )
+
+DEFAULT_CONCURRENCY = 8
+
+_local = threading.local()
+
+# Per event loop, per signer locks for the CLI backend, which submits a signer's transactions one
+# at a time. With the client backend, sequence numbers come from the signer's proposal key pool,
+# which keeps each key locked from assigning its sequence number until the transaction is
+# submitted: transactions on one key are serialized, transactions on different keys are not.
+_signer_locks = weakref.WeakKeyDictionary()
+
+def _thread_client():
+    # http.client connections are not thread safe, each executor thread keeps its own
+    if not hasattr(_local, "client"):
+        _local.client = FlowClient()
+    return _local.client
+
+def _signer_lock(signer):
+    locks = _signer_locks.setdefault(asyncio.get_running_loop(), {})
+    if signer not in locks:
+        locks[signer] = asyncio.Lock()
+    return locks[signer]
+
+def send_nft_auction_transaction_async(txname, args=None, signer='emulator-account', show=False):
+    txfile = f"cadence/transactions/NFTAuction/{txname}.cdc"
+    return send_transaction_async_driver(txfile, args, signer, show)
+
+def send_async_artwork_transaction_async(txname, args=None, signer='emulator-account', show=False):
+    txfile = f"cadence/transactions/AsyncArtwork/{txname}.cdc"
+    return send_transaction_async_driver(txfile, args, signer, show)
+
+def send_blueprints_transaction_async(txname, args=None, signer='emulator-account', show=False):
+    txfile = f"cadence/transactions/Blueprints/{txname}.cdc"
+    return send_transaction_async_driver(txfile, args, signer, show)
+
+def send_transaction_async(txname, args=None, signer='emulator-account', show=False):
+    txfile = f"cadence/transactions/{txname}.cdc"
+    return send_transaction_async_driver(txfile, args, signer, show)
+
+async def send_transaction_async_driver(txfilepath, args, signer, show):
+    if BACKEND == "client":
+        return await send_transaction_async_client_driver(txfilepath, args, signer, show)
+
+    command = transaction_command(txfilepath, args, signer)
+    async with _signer_lock(signer):
+        process = await asyncio.create_subprocess_exec(*command, stdout=PIPE)
+        deet, _ = await process.communicate()
+    if process.returncode != 0:
+        raise CalledProcessError(process.returncode, command, deet)
+
+    result = from_cli_output(deet.decode())
+    if show:
+        print(result)
+    return result
+
+async def send_transaction_async_client_driver(txfilepath, args, signer, show):
+    loop = asyncio.get_running_loop()
+    code, signer_account = prepare_transaction_file(txfilepath, signer)
+    arguments = construct_arg_list(args) if args else []
+
+    pool = key_pool_for(signer_account)
+
+    def submit():
+        return _thread_client().submit_with_proposal_key(code, arguments, signer_account)
+
+    for attempt in range(2):
+        tx_id = await loop.run_in_executor(None, submit)
+        result = await wait_for_seal_async(tx_id)
+        if attempt == 1 or not is_sequence_number_mismatch(result.get('error_message')):
+            break
+        await loop.run_in_executor(None, lambda: pool.resync(_thread_client()))
+
+    result = await loop.run_in_executor(None, lambda: transaction_result_from_access_api(result, _thread_client()))
+    if show:
+        print(result)
+    return result
+
+async def wait_for_seal_async(tx_id, timeout=SEAL_TIMEOUT):
+    loop = asyncio.get_running_loop()
+    deadline = time.monotonic() + timeout
+    while True:
+        result = await loop.run_in_executor(None, lambda: _thread_client().get_transaction_result(tx_id))
+        if result['status'] in ("Sealed", "Expired") or result.get('error_message'):
+            result['id'] = tx_id
+            return result
+        if time.monotonic() > deadline:
+            raise FlowClientError(f"Transaction {tx_id} not sealed after {timeout}s")
+        await asyncio.sleep(SEAL_POLL_INTERVAL)
+
+# Runs the given transaction coroutines with at most `limit` in flight, results in input order
+async def gather_transactions(*coroutines, limit=DEFAULT_CONCURRENCY):
+    semaphore = asyncio.Semaphore(limit)
+
+    async def bounded(coroutine):
+        async with semaphore:
+            return await coroutine
+
+    return await asyncio.gather(*(bounded(c) for c in coroutines))
+
+# Blocking entry point for tests that are not themselves async
+def run_transactions(*coroutines, limit=DEFAULT_CONCURRENCY):
+    return asyncio.run(gather_transactions(*coroutines, limit=limit))
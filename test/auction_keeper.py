@@ -0,0 +1,151 @@
+import heapq
+import sys
+import time
+
+from event_indexer import get_indexer
+from time_control import CLOCK_MARGIN, SETTLEMENT_GRACE_PERIOD
+from transaction_handler import send_nft_auction_transaction
+from utils import address
+
+# Settles NFTAuction auctions as soon as they can be settled. Auction end times are followed
+# through the event indexer and kept in a heap ordered by when each auction becomes settleable,
+# due auctions are settled batch_size at a time with settleAuctions. Emulator block timestamps
+# follow its wall clock, so the keeper sleeps on time.time() until the next auction is due.
+
+DEFAULT_BATCH_SIZE = 50
+DEFAULT_POLL_INTERVAL = 1.0
+# settleAuctions skips auctions it cannot settle, they are retried this much later up to MAX_ATTEMPTS times
+RETRY_DELAY = 5.0
+MAX_ATTEMPTS = 3
+
+# NftAuctionCreated and BidMade open an auction, AuctionPeriodUpdated sets its end. A bid can only be
+# withdrawn while under the minimum price, so BidWithdrawn leaves the auction open for the next bid
+OPENING_EVENTS = ["NftAuctionCreated", "BidMade", "BidWithdrawn"]
+# After these the auction has nothing left to settle
+CLOSING_EVENTS = ["AuctionSettled", "HighestBidTaken", "AuctionWithdrawn", "NFTTransferredAndSellerPaid"]
+
+def nft_auction_event(name):
+    return f'A.{address("NFTAuction")[2:]}.NFTAuction.{name}'
+
+def event_key(record):
+    # NftAuctionCreated names the type nftProjectIdentifier
+    nft_type = record.get("nftProjectIdentifier") if record.type.endswith(".NftAuctionCreated") else record.get("nftTypeIdentifier")
+    return (nft_type, record.get("tokenId"))
+
+class AuctionKeeper:
+    def __init__(self, signer, batch_size=DEFAULT_BATCH_SIZE, poll_interval=DEFAULT_POLL_INTERVAL, indexer=None, clock=time.time):
+        self.signer = signer
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.indexer = indexer or get_indexer()
+        self.clock = clock
+        # (nftTypeIdentifier, tokenId) -> auction end, None while the auction has no end
+        self.auctions = {}
+        # (settleable at, auction end, nftTypeIdentifier, tokenId), entries whose end is no longer current are skipped
+        self.queue = []
+        self.attempts = {}
+        self.height = -1
+        # Seconds from an auction becoming settleable to its settlement being sealed
+        self.lags = []
+        self.settled = []
+
+        self.event_types = [nft_auction_event(name) for name in OPENING_EVENTS + ["AuctionPeriodUpdated"] + CLOSING_EVENTS]
+        for event_type in self.event_types:
+            self.indexer.watch(event_type)
+
+    def schedule(self, key, end, due=None):
+        self.auctions[key] = end
+        heapq.heappush(self.queue, (due or float(end + SETTLEMENT_GRACE_PERIOD) + CLOCK_MARGIN, end, key))
+
+    # Applies the events sealed since the previous poll in chain order
+    def poll(self):
+        self.indexer.sync()
+        latest = min(self.indexer.cursors[event_type] for event_type in self.event_types)
+        if latest < self.height:
+            # The emulator was restarted, so were its auctions
+            self.auctions.clear()
+            self.queue.clear()
+            self.attempts.clear()
+            self.height = -1
+
+        records = []
+        for event_type in self.event_types:
+            records += self.indexer.events(event_type, start_height=self.height + 1, end_height=latest)
+        records.sort(key=lambda r: (r.block_height, r.transaction_index, r.event_index))
+
+        for record in records:
+            key = event_key(record)
+            name = record.type.rsplit(".", 1)[-1]
+            if name == "AuctionPeriodUpdated":
+                self.attempts.pop(key, None)
+                self.schedule(key, record.get("auctionEndPeriod"))
+            elif name == "NftAuctionCreated":
+                self.auctions[key] = None
+            elif name in ("BidMade", "BidWithdrawn"):
+                self.auctions.setdefault(key, None)
+            else:
+                self.auctions.pop(key, None)
+                self.attempts.pop(key, None)
+        self.height = latest
+
+    # Seconds until the next auction is due, None when nothing is scheduled
+    def next_due_in(self):
+        while self.queue and self.auctions.get(self.queue[0][2]) != self.queue[0][1]:
+            heapq.heappop(self.queue)
+        return max(0.0, self.queue[0][0] - self.clock()) if self.queue else None
+
+    def pop_due(self):
+        due = []
+        while len(due) < self.batch_size and self.next_due_in() == 0.0:
+            settleable_at, end, key = heapq.heappop(self.queue)
+            due.append((settleable_at, end, key))
+        return due
+
+    # Sends settleAuctions for the given (settleable at, end, key) entries, reschedules the ones it skipped
+    def settle(self, due):
+        args = [["Array", [["String", key[0]] for _, _, key in due]], ["Array", [["UInt64", str(key[1])] for _, _, key in due]]]
+        result = send_nft_auction_transaction("settleAuctions", args=args, signer=self.signer)
+        sealed_at = self.clock()
+
+        settled = {(e.get("nftTypeIdentifier"), e.get("tokenId")) for e in result.events if e.type.endswith(".NFTAuction.AuctionSettled")} if result else set()
+        for settleable_at, end, key in due:
+            if key in settled:
+                self.auctions.pop(key, None)
+                self.attempts.pop(key, None)
+                self.lags.append(sealed_at - settleable_at)
+                self.settled.append(key)
+                continue
+            self.attempts[key] = self.attempts.get(key, 0) + 1
+            if self.attempts[key] < MAX_ATTEMPTS:
+                self.schedule(key, end, due=sealed_at + RETRY_DELAY)
+            else:
+                print(f"Giving up on settling {key[0]} {key[1]}: {result.error_message or 'skipped by settleAuctions'}")
+        return result
+
+    # One keeper iteration, returns the number of auctions settled
+    def run_once(self):
+        self.poll()
+        count = len(self.settled)
+        due = self.pop_due()
+        while due:
+            self.settle(due)
+            due = self.pop_due()
+        return len(self.settled) - count
+
+    # Runs until stop() returns True (forever by default), sleeping until the next auction is due
+    # but at most poll_interval so new auctions are picked up
+    def run(self, stop=lambda: False):
+        while not stop():
+            self.run_once()
+            next_due = self.next_due_in()
+            time.sleep(self.poll_interval if next_due is None else min(self.poll_interval, next_due))
+
+    def lag_summary(self):
+        if not self.lags:
+            return {}
+        lags = sorted(self.lags)
+        return {'settled': len(lags), 'mean': sum(lags) / len(lags), 'median': lags[len(lags) // 2], 'max': lags[-1]}
+
+if __name__ == '__main__':
+    # python auction_keeper.py [signer], signer being a flow.json account with a MarketplaceClient
+    AuctionKeeper(sys.argv[1] if len(sys.argv) > 1 else "AsyncArtAccount").run()
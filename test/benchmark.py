@@ -0,0 +1,184 @@
+import json
+import os
+import statistics
+import subprocess
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Optional
+
+# Computation cost and latency tracking for transactions. While a recorder is active every
+# transaction sent through transaction_handler is recorded under its file (relative to
+# cadence/transactions) and the current input size, see benchmark_size(). A finished run is
+# appended to the history file and compared against the baseline:
+#
+#   FLOW_BENCHMARK=1 pytest -m benchmark
+#
+# runs the parameterized sweeps in System/test_benchmark_computation_cost.py, FLOW_BENCHMARK=1
+# on any other selection records the transactions those tests send.
+
+ENABLED = os.environ.get("FLOW_BENCHMARK") == "1"
+HISTORY_PATH = os.environ.get("FLOW_BENCHMARK_HISTORY", "benchmark_history.jsonl")
+# Without a baseline file the most recent run in the history is the baseline
+BASELINE_PATH = os.environ.get("FLOW_BENCHMARK_BASELINE", "benchmark_baseline.json")
+UPDATE_BASELINE = os.environ.get("FLOW_BENCHMARK_UPDATE_BASELINE") == "1"
+
+# Computation is deterministic for the same code and inputs, latency is noisy on shared runners
+COMPUTATION_TOLERANCE = float(os.environ.get("FLOW_BENCHMARK_COMPUTATION_TOLERANCE", "0.05"))
+LATENCY_TOLERANCE = float(os.environ.get("FLOW_BENCHMARK_LATENCY_TOLERANCE", "0.5"))
+
+TRANSACTIONS_DIR = "cadence/transactions/"
+
+@dataclass
+class Sample:
+    transaction: str
+    size: Optional[int]
+    succeeded: bool
+    computation_used: Optional[int]
+    latency: float
+
+def case_key(transaction, size):
+    return transaction if size is None else f"{transaction}[{size}]"
+
+class BenchmarkRecorder:
+    def __init__(self):
+        self.samples = []
+        self.storage = {}
+        self.size = None
+
+    def record(self, txfilepath, result, latency):
+        transaction = txfilepath[len(TRANSACTIONS_DIR):] if txfilepath.startswith(TRANSACTIONS_DIR) else txfilepath
+        transaction = transaction[:-len(".cdc")] if transaction.endswith(".cdc") else transaction
+        self.samples.append(Sample(transaction, self.size, bool(result), result.computation_used, latency))
+
+    # Account storage in bytes that a case added, recorded next to the transaction's computation
+    def record_storage(self, txname, storage_used):
+        key = case_key(txname, self.size)
+        self.storage[key] = max(storage_used, self.storage.get(key, storage_used))
+
+    # Per case: computation of the most expensive execution, median latency, whether all succeeded
+    # and the storage it added when that was recorded
+    def summary(self):
+        cases = {}
+        for sample in self.samples:
+            cases.setdefault(case_key(sample.transaction, sample.size), []).append(sample)
+        summary = {}
+        for key, samples in sorted(cases.items()):
+            computations = [s.computation_used for s in samples if s.computation_used is not None]
+            summary[key] = {
+                'runs': len(samples),
+                'succeeded': all(s.succeeded for s in samples),
+                'computation_used': max(computations) if computations else None,
+                'latency': round(statistics.median(s.latency for s in samples), 4),
+                'storage_used': self.storage.get(key)
+            }
+        return summary
+
+    def save(self, history_path=HISTORY_PATH):
+        entry = {'timestamp': time.time(), 'commit': current_commit(), 'cases': self.summary()}
+        with open(history_path, "a") as f:
+            f.write(json.dumps(entry) + "\n")
+        return entry
+
+def current_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def load_history(history_path=HISTORY_PATH):
+    if not os.path.exists(history_path):
+        return []
+    with open(history_path, "r") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+def load_baseline(baseline_path=BASELINE_PATH, history_path=HISTORY_PATH):
+    if os.path.exists(baseline_path):
+        with open(baseline_path, "r") as f:
+            return json.load(f)['cases']
+    history = load_history(history_path)
+    return history[-1]['cases'] if history else {}
+
+def write_baseline(entry, baseline_path=BASELINE_PATH):
+    with open(baseline_path, "w") as f:
+        f.write(json.dumps(entry, indent=4))
+
+# Human readable descriptions of every case that got more expensive than its baseline. Latency
+# is only compared when asked for, it is reported but does not fail a run
+def find_regressions(cases, baseline, latency=False):
+    regressions = []
+    for key, case in cases.items():
+        before = baseline.get(key)
+        if before is None:
+            continue
+        if latency:
+            if before['latency'] and case['latency'] > before['latency'] * (1 + LATENCY_TOLERANCE):
+                regressions.append(f"{key}: latency {before['latency']}s -> {case['latency']}s")
+            continue
+        if before['succeeded'] and not case['succeeded']:
+            regressions.append(f"{key}: succeeded in the baseline, now fails")
+        if case['computation_used'] is not None and before['computation_used']:
+            if case['computation_used'] > before['computation_used'] * (1 + COMPUTATION_TOLERANCE):
+                regressions.append(f"{key}: computation {before['computation_used']} -> {case['computation_used']}")
+        # Older history entries do not have storage
+        if case.get('storage_used') is not None and before.get('storage_used'):
+            if case['storage_used'] > before['storage_used'] * (1 + COMPUTATION_TOLERANCE):
+                regressions.append(f"{key}: storage {before['storage_used']} -> {case['storage_used']} bytes")
+    return regressions
+
+def format_summary(cases):
+    lines = [f"{'case':<50} {'ok':>3} {'computation':>12} {'latency':>9} {'storage':>9}"]
+    for key, case in cases.items():
+        computation = "-" if case['computation_used'] is None else str(case['computation_used'])
+        storage = "-" if case.get('storage_used') is None else str(case['storage_used'])
+        lines.append(f"{key:<50} {'y' if case['succeeded'] else 'n':>3} {computation:>12} {case['latency']:>8.3f}s {storage:>9}")
+    return "\n".join(lines)
+
+_recorder = None
+
+def active_recorder():
+    return _recorder
+
+def start_recording():
+    global _recorder
+    _recorder = BenchmarkRecorder()
+    return _recorder
+
+# Saves the run, prints it and returns the regressions against the baseline
+def finish_recording():
+    global _recorder
+    recorder, _recorder = _recorder, None
+    if recorder is None or not recorder.samples:
+        return []
+    baseline = load_baseline()
+    entry = recorder.save()
+    if UPDATE_BASELINE:
+        write_baseline(entry)
+    print(format_summary(entry['cases']))
+    for slowdown in find_regressions(entry['cases'], baseline, latency=True):
+        print(f"SLOWER {slowdown}")
+    regressions = find_regressions(entry['cases'], baseline)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return regressions
+
+def record_transaction(txfilepath, result, latency):
+    if _recorder is not None:
+        _recorder.record(txfilepath, result, latency)
+
+# txname as recorded for transactions, e.g. "AsyncArtwork/mintControlToken"
+def record_storage(txname, storage_used):
+    if _recorder is not None:
+        _recorder.record_storage(txname, storage_used)
+
+# Transactions sent inside the block are recorded as input size `size`
+@contextmanager
+def benchmark_size(size):
+    previous = _recorder.size if _recorder else None
+    if _recorder:
+        _recorder.size = size
+    try:
+        yield
+    finally:
+        if _recorder:
+            _recorder.size = previous
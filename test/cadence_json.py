@@ -0,0 +1,117 @@
+import json
+import keyword
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any
+
+# Helpers for JSON-Cadence values, the encoding the access API uses for script results
+# and event payloads.
+
+COMPOSITE_TYPES = ("Struct", "Resource", "Event", "Contract", "Enum")
+INTEGER_TYPE_PREFIXES = ("Int", "UInt", "Word")
+
+def format_static_type(static_type):
+    if isinstance(static_type, str):
+        return static_type
+    if static_type.get('typeID'):
+        return static_type['typeID']
+    kind = static_type.get('kind')
+    if kind == "Optional":
+        return format_static_type(static_type['type']) + "?"
+    if kind in ("VariableSizedArray", "ConstantSizedArray"):
+        return "[" + format_static_type(static_type['type']) + "]"
+    if kind == "Dictionary":
+        return "{" + format_static_type(static_type['key']) + ": " + format_static_type(static_type['value']) + "}"
+    if kind == "Reference":
+        return ("auth " if static_type.get('authorized') else "") + "&" + format_static_type(static_type['type'])
+    if kind == "Restriction":
+        restrictions = ", ".join(format_static_type(r) for r in static_type['restrictions'])
+        return format_static_type(static_type['type']) + "{" + restrictions + "}"
+    return kind
+
+def format_path(path):
+    return f"/{path['domain']}/{path['identifier']}"
+
+# Renders a JSON-Cadence value the way Cadence's String() does, which is what
+# `flow scripts execute` prints after "Result: ".
+def format_value(value):
+    kind = value['type']
+    inner = value.get('value')
+
+    if kind == "Optional":
+        return "nil" if inner is None else format_value(inner)
+    if kind == "Void":
+        return "()"
+    if kind == "Bool":
+        return "true" if inner else "false"
+    if kind in ("String", "Character"):
+        return json.dumps(inner, ensure_ascii=False)
+    if kind == "Array":
+        return "[" + ", ".join(format_value(v) for v in inner) + "]"
+    if kind == "Dictionary":
+        return "{" + ", ".join(format_value(kv['key']) + ": " + format_value(kv['value']) for kv in inner) + "}"
+    if kind in COMPOSITE_TYPES:
+        fields = ", ".join(f"{field['name']}: {format_value(field['value'])}" for field in inner['fields'])
+        return f"{inner['id']}({fields})"
+    if kind == "Path":
+        return format_path(inner)
+    if kind == "Type":
+        return f"Type<{format_static_type(inner['staticType'])}>()"
+    if kind == "Capability":
+        borrow_type = format_static_type(inner['borrowType'])
+        path = inner['path']
+        if isinstance(path, dict):
+            path = format_value(path) if 'type' in path else format_path(path)
+        return f"Capability<{borrow_type}>(address: {inner['address']}, path: {path})"
+    # Address, Int*/UInt*/Word*, Fix64 and UFix64 are already rendered as Cadence literals
+    return inner
+
+# Generated struct classes, keyed by Cadence type id and field names
+_composite_classes = {}
+
+def composite_class(type_id, field_names):
+    key = (type_id, field_names)
+    if key not in _composite_classes:
+        # Cadence field names may collide with Python keywords (e.g. `from` on Withdraw events)
+        attributes = tuple(name + "_" if keyword.iskeyword(name) else name for name in field_names)
+        namespace = {
+            '__slots__': attributes,
+            '__annotations__': {name: Any for name in attributes},
+            'type_id': type_id
+        }
+        cls = type(type_id.split(".")[-1], (), namespace)
+        _composite_classes[key] = dataclass(frozen=True)(cls)
+    return _composite_classes[key]
+
+def decode_address(addr):
+    return int(addr, 16)
+
+# Decodes a JSON-Cadence value into plain Python values: composites become frozen slotted
+# dataclasses (with the Cadence type id on `type_id`), dictionaries dicts, arrays lists,
+# fixed point numbers Decimals, integers ints and addresses ints.
+def decode_value(value):
+    kind = value['type']
+    inner = value.get('value')
+
+    if kind == "Optional":
+        return None if inner is None else decode_value(inner)
+    if kind == "Void":
+        return None
+    if kind in ("Bool", "String", "Character"):
+        return inner
+    if kind == "Address":
+        return decode_address(inner)
+    if kind in ("Fix64", "UFix64"):
+        return Decimal(inner)
+    if kind.startswith(INTEGER_TYPE_PREFIXES):
+        return int(inner)
+    if kind == "Array":
+        return [decode_value(v) for v in inner]
+    if kind == "Dictionary":
+        return {decode_value(kv['key']): decode_value(kv['value']) for kv in inner}
+    if kind in COMPOSITE_TYPES:
+        names = tuple(field['name'] for field in inner['fields'])
+        cls = composite_class(inner['id'], names)
+        return cls(*[decode_value(field['value']) for field in inner['fields']])
+    # Paths, types and capabilities are compared by their Cadence representation
+    return format_value(value)
@@ -0,0 +1,14 @@
+from benchmark import ENABLED, start_recording, finish_recording
+import pytest
+
+# With FLOW_BENCHMARK=1 every transaction sent during the session is recorded, appended to the
+# benchmark history and compared against the baseline when the session ends
+@pytest.fixture(scope="session", autouse=True)
+def benchmark_recording():
+  if not ENABLED:
+    yield
+    return
+  start_recording()
+  yield
+  regressions = finish_recording()
+  assert not regressions, "Computation cost regressions:\n" + "\n".join(regressions)
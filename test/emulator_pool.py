@@ -0,0 +1,172 @@
+import http.client
+import os
+import shlex
+import signal
+import socket
+import subprocess
+import time
+from urllib.parse import urlencode
+
+# Emulator instances the suite can run against. Outside of pytest-xdist there is a single
+# emulator configured by flow.json on the default ports. Under xdist (`pytest -n N`) each
+# worker gets its own instance: an emulator on its own ports, with its own generated flow
+# config (flow.<worker>.json) and account set, so workers never share chain state.
+
+BASE_FLOW_CONFIG = "flow.json"
+DEFAULT_PORT = 3569
+DEFAULT_REST_PORT = 8888
+DEFAULT_ADMIN_PORT = 8080
+PORT_STRIDE = 10
+
+STARTUP_TIMEOUT = float(os.environ.get("FLOW_EMULATOR_STARTUP_TIMEOUT", "30"))
+STARTUP_INITIAL_DELAY = 0.02
+STARTUP_MAX_DELAY = 0.5
+STARTUP_BACKOFF = 1.5
+# If set, every startup latency is appended to this file as "<instance> <seconds>"
+STARTUP_LOG = os.environ.get("FLOW_EMULATOR_STARTUP_LOG")
+LOG_TAIL_LINES = 40
+
+class EmulatorStartupError(Exception):
+    pass
+
+class EmulatorAdminError(Exception):
+    pass
+
+class EmulatorInstance:
+    def __init__(self, index, name=None):
+        self.index = index
+        self.name = name
+        self.port = DEFAULT_PORT + index * PORT_STRIDE
+        self.rest_port = DEFAULT_REST_PORT + index * PORT_STRIDE
+        self.admin_port = DEFAULT_ADMIN_PORT + index * PORT_STRIDE
+        suffix = "" if name is None else f".{name}"
+        self.config_path = BASE_FLOW_CONFIG if name is None else f"flow{suffix}.json"
+        self.log_path = f"emulator{suffix}.log"
+        self.pid_path = f"emulator{suffix}.pid"
+        self.startup_latencies = []
+
+    @property
+    def is_default(self):
+        return self.name is None
+
+    # Extra arguments for every `flow` CLI invocation that targets this instance
+    @property
+    def cli_args(self):
+        return [] if self.is_default else ["-f", self.config_path]
+
+    @property
+    def access_api(self):
+        return f"127.0.0.1:{self.rest_port}"
+
+    @property
+    def admin_api(self):
+        return f"127.0.0.1:{self.admin_port}"
+
+    def emulator_flags(self):
+        if self.is_default:
+            return ""
+        return f" -f {self.config_path} --port {self.port} --rest-port {self.rest_port} --admin-port {self.admin_port}"
+
+    def start(self, command):
+        command += self.emulator_flags()
+        if self.is_default:
+            os.system(f"{command} 2>&1 > {self.log_path} &")
+            return
+        with open(self.log_path, "w") as log:
+            process = subprocess.Popen(shlex.split(command), stdout=log, stderr=subprocess.STDOUT)
+        with open(self.pid_path, "w") as f:
+            f.write(str(process.pid))
+
+    def is_ready(self):
+        # The gRPC port accepting connections is not enough, the REST API must serve a sealed block
+        try:
+            socket.create_connection(("127.0.0.1", self.port), timeout=1).close()
+            connection = http.client.HTTPConnection("127.0.0.1", self.rest_port, timeout=1)
+            try:
+                connection.request("GET", "/v1/blocks?height=sealed")
+                return connection.getresponse().status == 200
+            finally:
+                connection.close()
+        except OSError:
+            return False
+
+    def log_tail(self):
+        if not os.path.exists(self.log_path):
+            return ""
+        with open(self.log_path, "r", errors="replace") as f:
+            return "".join(f.readlines()[-LOG_TAIL_LINES:])
+
+    def wait_until_ready(self, started_at, timeout=STARTUP_TIMEOUT):
+        delay = STARTUP_INITIAL_DELAY
+        while not self.is_ready():
+            if time.monotonic() - started_at > timeout:
+                raise EmulatorStartupError(f"Emulator on port {self.port} not ready after {timeout}s, {self.log_path}:\n{self.log_tail()}")
+            time.sleep(delay)
+            delay = min(delay * STARTUP_BACKOFF, STARTUP_MAX_DELAY)
+
+        latency = time.monotonic() - started_at
+        self.startup_latencies.append(latency)
+        print(f"Emulator on port {self.port} ready in {latency:.3f}s")
+        if STARTUP_LOG:
+            with open(STARTUP_LOG, "a") as f:
+                f.write(f"{self.name or 'default'} {latency:.3f}\n")
+        return latency
+
+    def stop(self):
+        if self.is_default:
+            os.system("pkill -9 flow 2>&1 > /dev/null")
+            return
+        # Only stop this instance's emulator, other workers' emulators keep running
+        if os.path.exists(self.pid_path):
+            with open(self.pid_path, "r") as f:
+                pid = int(f.read().strip())
+            try:
+                os.kill(pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            os.remove(self.pid_path)
+
+    def configure(self, flow_json):
+        # Point the generated config's emulator and network entries at this instance's ports
+        if self.is_default:
+            return flow_json
+        flow_json.setdefault('emulators', {}).setdefault('default', {'serviceAccount': "emulator-account"})['port'] = self.port
+        flow_json.setdefault('networks', {})['emulator'] = f"127.0.0.1:{self.port}"
+        return flow_json
+
+class EmulatorPool:
+    def __init__(self, size):
+        self.instances = [EmulatorInstance(i + 1, f"gw{i}") for i in range(size)]
+
+    def for_worker(self, worker_id):
+        if worker_id is None:
+            return EmulatorInstance(0)
+        index = int(worker_id[2:])
+        if index >= len(self.instances):
+            self.instances.extend(EmulatorInstance(i + 1, f"gw{i}") for i in range(len(self.instances), index + 1))
+        return self.instances[index]
+
+# Calls the emulator's admin API (snapshots, block production), by default on the current instance
+def admin_request(method, path, form=None, admin_api=None):
+    host, _, port = (admin_api or os.environ.get("FLOW_EMULATOR_ADMIN") or current_emulator().admin_api).partition(":")
+    connection = http.client.HTTPConnection(host, int(port), timeout=30)
+    try:
+        body = urlencode(form) if form else None
+        headers = {"Content-Type": "application/x-www-form-urlencoded"} if form else {}
+        connection.request(method, path, body=body, headers=headers)
+        response = connection.getresponse()
+        data = response.read().decode()
+    finally:
+        connection.close()
+    if response.status >= 400:
+        raise EmulatorAdminError(f"Emulator admin request {method} {path} failed ({response.status}): {data}")
+    return data
+
+_current = None
+
+def current_emulator():
+    global _current
+    if _current is None:
+        pool = EmulatorPool(int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", "0")))
+        _current = pool.for_worker(os.environ.get("PYTEST_XDIST_WORKER"))
+    return _current
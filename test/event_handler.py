@@ -1,8 +1,10 @@
 import json
 from subprocess import check_output, run
+from emulator_pool import current_emulator
+from event_indexer import get_indexer
 
 def check_for_n_event_occurences_over_x_blocks(num_prev_blocks, num_expected_occurences, event_name, show=False):
-    event_details = check_output(["flow", "events", "get", event_name, "--last", num_prev_blocks])
+    event_details = check_output(["flow", "events", "get", event_name, "--last", num_prev_blocks] + current_emulator().cli_args)
     formatted_event_details = event_details.decode()
     if show:
         print(formatted_event_details)
@@ -10,3 +12,14 @@ def check_for_n_event_occurences_over_x_blocks(num_prev_blocks, num_expected_occ
 
 def check_for_event(event_name, show=False):
     return check_for_n_event_occurences_over_x_blocks("1", 1, event_name, show)
+
+# Decoded events of a type, optionally restricted to a block range and to events whose fields
+# equal (or, given a callable, satisfy) the keyword arguments
+def find_events(event_name, start_height=None, end_height=None, **fields):
+    return get_indexer().events(event_name, start_height, end_height, **fields)
+
+def check_for_indexed_event(event_name, start_height=None, end_height=None, num_expected_occurences=1, **fields):
+    return len(find_events(event_name, start_height, end_height, **fields)) >= num_expected_occurences
+
+def latest_indexed_height(event_name):
+    return get_indexer().latest_height(event_name)
@@ -0,0 +1,110 @@
+import base64
+import json
+import keyword
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from typing import Any
+
+from cadence_json import decode_value
+from flow_client import get_client
+
+# The access API serves at most this many blocks per events request
+MAX_BLOCK_RANGE = 250
+
+@dataclass(frozen=True)
+class EventRecord:
+    __slots__ = ('type', 'block_height', 'block_id', 'transaction_id', 'transaction_index', 'event_index', 'fields')
+    type: str
+    block_height: int
+    block_id: str
+    transaction_id: str
+    transaction_index: int
+    event_index: int
+    fields: Any
+
+    def get(self, name):
+        # decode_value suffixes fields that are Python keywords, e.g. Withdraw(id, from)
+        return getattr(self.fields, name + "_" if keyword.iskeyword(name) else name)
+
+def decode_event(event, block_height, block_id):
+    payload = json.loads(base64.b64decode(event['payload']))
+    return EventRecord(
+        type=event['type'],
+        block_height=block_height,
+        block_id=block_id,
+        transaction_id=event['transaction_id'],
+        transaction_index=int(event['transaction_index']),
+        event_index=int(event['event_index']),
+        fields=decode_value(payload)
+    )
+
+# Keeps the records whose fields equal (or, given a callable, satisfy) the keyword arguments
+def filter_events(records, **fields):
+    for name, expected in fields.items():
+        records = [r for r in records if (expected(r.get(name)) if callable(expected) else r.get(name) == expected)]
+    return records
+
+# Incrementally indexes events of the watched types. Each type keeps a cursor (the last block
+# height it was synced to), so a sync only fetches blocks sealed since the previous one.
+class EventIndexer:
+    def __init__(self, client=None):
+        self.client = client or get_client()
+        self.cursors = {}
+        self.records = {}
+        self.heights = {}
+
+    def reset(self):
+        self.cursors.clear()
+        self.records.clear()
+        self.heights.clear()
+
+    def watch(self, event_type):
+        if event_type not in self.cursors:
+            self.cursors[event_type] = -1
+            self.records[event_type] = []
+            self.heights[event_type] = []
+
+    def sync(self, event_type=None):
+        latest = int(self.client.get_latest_sealed_block()['height'])
+        if any(cursor > latest for cursor in self.cursors.values()):
+            # The emulator was restarted underneath us, the index describes a chain that is gone
+            watched = list(self.cursors)
+            self.reset()
+            for watched_type in watched:
+                self.watch(watched_type)
+
+        for watched_type in ([event_type] if event_type else list(self.cursors)):
+            self.watch(watched_type)
+            self.sync_type(watched_type, latest)
+
+    def sync_type(self, event_type, latest):
+        start = self.cursors[event_type] + 1
+        while start <= latest:
+            end = min(start + MAX_BLOCK_RANGE - 1, latest)
+            blocks = self.client.request("GET", f"/v1/events?type={event_type}&start_height={start}&end_height={end}")
+            for block in blocks:
+                height = int(block['block_height'])
+                for event in block['events']:
+                    self.records[event_type].append(decode_event(event, height, block['block_id']))
+                    self.heights[event_type].append(height)
+            self.cursors[event_type] = end
+            start = end + 1
+
+    def events(self, event_type, start_height=None, end_height=None, **fields):
+        self.sync(event_type)
+        heights = self.heights[event_type]
+        lo = 0 if start_height is None else bisect_left(heights, start_height)
+        hi = len(heights) if end_height is None else bisect_right(heights, end_height)
+        return filter_events(self.records[event_type][lo:hi], **fields)
+
+    def latest_height(self, event_type):
+        self.sync(event_type)
+        return self.cursors[event_type]
+
+_indexer = None
+
+def get_indexer():
+    global _indexer
+    if _indexer is None:
+        _indexer = EventIndexer()
+    return _indexer
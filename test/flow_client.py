@@ -0,0 +1,253 @@
+import base64
+import http.client
+import json
+import os
+import re
+import time
+from functools import lru_cache
+
+from emulator_pool import current_emulator
+from flow_config import get_flow_config
+from flow_crypto import public_key_from_private, sign
+from proposal_keys import get_key_pool, is_sequence_number_mismatch
+
+# In-process client for the emulator's REST access API. It keeps a single HTTP connection
+# open for the lifetime of the test process and signs transactions locally, instead of
+# forking a `flow` CLI process (which re-reads flow.json and reconnects) for every call.
+
+# "cli" forks the flow CLI per call, "client" goes through this module
+BACKEND = os.environ.get("FLOW_BACKEND", "cli")
+ACCESS_API = os.environ.get("FLOW_ACCESS_API") or current_emulator().access_api
+DEFAULT_GAS_LIMIT = 1000
+SEAL_POLL_INTERVAL = 0.05
+SEAL_TIMEOUT = 30
+
+TRANSACTION_DOMAIN_TAG = b"FLOW-V0.0-transaction".ljust(32, b"\x00")
+
+IMPORT_PATTERN = re.compile(r'import\s+(\w+)\s+from\s+"[^"]+"')
+
+class FlowClientError(Exception):
+    pass
+
+def rlp_encode(item):
+    if isinstance(item, list):
+        payload = b"".join(rlp_encode(x) for x in item)
+        return _rlp_length_prefix(len(payload), 0xc0) + payload
+    if isinstance(item, int):
+        item = item.to_bytes((item.bit_length() + 7) // 8, "big")
+    if len(item) == 1 and item[0] < 0x80:
+        return item
+    return _rlp_length_prefix(len(item), 0x80) + item
+
+def _rlp_length_prefix(length, offset):
+    if length < 56:
+        return bytes([offset + length])
+    length_bytes = length.to_bytes((length.bit_length() + 7) // 8, "big")
+    return bytes([offset + 55 + len(length_bytes)]) + length_bytes
+
+# RLP fields of a transaction payload. Addresses are hex without 0x, padded to 8 bytes
+def transaction_payload(code, arguments, reference_block_id, gas_limit, proposer, key_index, sequence_number, payer, authorizers):
+    return [
+        code.encode(),
+        arguments,
+        bytes.fromhex(reference_block_id),
+        gas_limit,
+        bytes.fromhex(proposer),
+        key_index,
+        sequence_number,
+        bytes.fromhex(payer),
+        [bytes.fromhex(authorizer) for authorizer in authorizers]
+    ]
+
+# Signed by each authorizer that is not the payer
+def payload_message(payload):
+    return TRANSACTION_DOMAIN_TAG + rlp_encode(payload)
+
+# Signed by the payer, payload_signatures being [signer index, key index, signature] lists
+def envelope_message(payload, payload_signatures):
+    return TRANSACTION_DOMAIN_TAG + rlp_encode([payload, payload_signatures])
+
+def load_flow_config():
+    config = get_flow_config()
+    return config.accounts, config.contracts
+
+def resolve_imports(code, contracts):
+    def replace(match):
+        name = match.group(1)
+        if name not in contracts:
+            raise FlowClientError(f"No emulator address for imported contract {name}")
+        return f"import {name} from 0x{contracts[name]}"
+    return IMPORT_PATTERN.sub(replace, code)
+
+@lru_cache(maxsize=None)
+def public_key_for(private_key):
+    return public_key_from_private(private_key)
+
+def key_pool_for(signer):
+    return get_key_pool(signer['address'], public_key_for(signer['key']))
+
+def encode_argument(arg):
+    return json.dumps(arg, separators=(",", ":")).encode()
+
+class FlowClient:
+    def __init__(self, access_api=ACCESS_API):
+        self.host, _, port = access_api.partition(":")
+        self.port = int(port) if port else 8888
+        self.connection = None
+
+    def close(self):
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    def request(self, method, path, body=None):
+        payload = json.dumps(body).encode() if body is not None else None
+        headers = {"Content-Type": "application/json"} if payload is not None else {}
+        # The emulator is restarted between test modules, so a stale connection is retried once
+        for attempt in range(2):
+            if self.connection is None:
+                self.connection = http.client.HTTPConnection(self.host, self.port, timeout=SEAL_TIMEOUT)
+            try:
+                self.connection.request(method, path, body=payload, headers=headers)
+                response = self.connection.getresponse()
+                data = response.read()
+                break
+            except (http.client.HTTPException, ConnectionError, OSError):
+                self.close()
+                if attempt == 1:
+                    raise
+        if response.status >= 400:
+            raise FlowClientError(f"{method} {path} failed ({response.status}): {data.decode()}")
+        return json.loads(data) if data else None
+
+    def get_latest_sealed_block(self):
+        return self.request("GET", "/v1/blocks?height=sealed")[0]['header']
+
+    def get_block_header(self, block_id):
+        return self.request("GET", f"/v1/blocks/{block_id}")[0]['header']
+
+    def get_account_key(self, address, key_index=0):
+        account = self.request("GET", f"/v1/accounts/{address}?expand=keys")
+        for key in account['keys']:
+            if int(key['index']) == key_index:
+                return key
+        raise FlowClientError(f"Account {address} has no key {key_index}")
+
+    # authorizers are flow.json accounts that authorize the transaction after the signer, each signing the payload with key 0
+    def build_transaction(self, code, args, signer, key_index=0, sequence_number=None, gas_limit=DEFAULT_GAS_LIMIT, authorizers=()):
+        address = signer['address']
+        if sequence_number is None:
+            sequence_number = int(self.get_account_key(address, key_index)['sequence_number'])
+        reference_block_id = self.get_latest_sealed_block()['id']
+        arguments = [encode_argument(arg) for arg in args]
+
+        # The signer is proposer, payer and first authorizer, as with `flow transactions send --signer`
+        payload = transaction_payload(
+            code,
+            arguments,
+            reference_block_id,
+            gas_limit,
+            address,
+            key_index,
+            sequence_number,
+            address,
+            [address] + [authorizer['address'] for authorizer in authorizers]
+        )
+        # Signer indices follow the transaction's signer list: the signer, then each further authorizer
+        payload_signatures = [
+            [index + 1, 0, sign(authorizer['key'], payload_message(payload))]
+            for index, authorizer in enumerate(authorizers)
+        ]
+        signature = sign(signer['key'], envelope_message(payload, payload_signatures))
+
+        return {
+            "script": base64.b64encode(code.encode()).decode(),
+            "arguments": [base64.b64encode(arg).decode() for arg in arguments],
+            "reference_block_id": reference_block_id,
+            "gas_limit": str(gas_limit),
+            "payer": address,
+            "proposal_key": {
+                "address": address,
+                "key_index": str(key_index),
+                "sequence_number": str(sequence_number)
+            },
+            "authorizers": [address] + [authorizer['address'] for authorizer in authorizers],
+            "payload_signatures": [{
+                "address": authorizer['address'],
+                "key_index": "0",
+                "signature": base64.b64encode(payload_signature[2]).decode()
+            } for authorizer, payload_signature in zip(authorizers, payload_signatures)],
+            "envelope_signatures": [{
+                "address": address,
+                "key_index": str(key_index),
+                "signature": base64.b64encode(signature).decode()
+            }]
+        }
+
+    def submit_transaction(self, transaction):
+        return self.request("POST", "/v1/transactions", transaction)['id']
+
+    def get_transaction_result(self, tx_id):
+        return self.request("GET", f"/v1/transaction_results/{tx_id}")
+
+    def wait_for_seal(self, tx_id, timeout=SEAL_TIMEOUT):
+        deadline = time.monotonic() + timeout
+        while True:
+            result = self.get_transaction_result(tx_id)
+            if result['status'] in ("Sealed", "Expired") or result.get('error_message'):
+                # The access API does not echo the id back
+                result['id'] = tx_id
+                return result
+            if time.monotonic() > deadline:
+                raise FlowClientError(f"Transaction {tx_id} not sealed after {timeout}s")
+            time.sleep(SEAL_POLL_INTERVAL)
+
+    def execute_script(self, code, args):
+        body = {
+            "script": base64.b64encode(code.encode()).decode(),
+            "arguments": [base64.b64encode(encode_argument(arg)).decode() for arg in args]
+        }
+        result = self.request("POST", "/v1/scripts?block_height=sealed", body)
+        return json.loads(base64.b64decode(result))
+
+    # Signs with the next proposal key of the signer's pool, resyncing once if the local
+    # sequence number turns out to be stale. The key stays locked until the transaction is
+    # submitted, so concurrent callers sharing a key submit in sequence number order
+    def submit_with_proposal_key(self, code, args, signer, gas_limit=DEFAULT_GAS_LIMIT, authorizers=()):
+        pool = key_pool_for(signer)
+        for attempt in range(2):
+            with pool.proposal_key(self) as (key_index, sequence_number):
+                transaction = self.build_transaction(code, args, signer, key_index, sequence_number, gas_limit, authorizers)
+                try:
+                    return self.submit_transaction(transaction)
+                except FlowClientError as e:
+                    if attempt == 1 or not is_sequence_number_mismatch(str(e)):
+                        raise
+            pool.resync(self)
+
+    def send_transaction(self, code, args, signer, gas_limit=DEFAULT_GAS_LIMIT, authorizers=()):
+        for attempt in range(2):
+            result = self.wait_for_seal(self.submit_with_proposal_key(code, args, signer, gas_limit, authorizers))
+            if attempt == 1 or not is_sequence_number_mismatch(result.get('error_message')):
+                return result
+            key_pool_for(signer).resync(self)
+
+_client = None
+
+def get_client():
+    global _client
+    if _client is None:
+        _client = FlowClient()
+    return _client
+
+# Resolved source of a transaction file and the flow.json account that signs it
+def prepare_transaction_file(txfilepath, signer):
+    accounts, contracts = load_flow_config()
+    with open(txfilepath, "r") as f:
+        code = resolve_imports(f.read(), contracts)
+    return code, accounts[signer]
+
+def send_transaction_file(txfilepath, args, signer, gas_limit=None, authorizers=()):
+    code, signer_account = prepare_transaction_file(txfilepath, signer)
+    accounts = get_flow_config().accounts
+    return get_client().send_transaction(code, args or [], signer_account, gas_limit or DEFAULT_GAS_LIMIT, [accounts[name] for name in authorizers])
@@ -0,0 +1,82 @@
+import json
+import os
+import threading
+
+from emulator_pool import current_emulator
+
+# Parsed view of flow.json. The file is only re-parsed when its mtime (or size) changes,
+# e.g. after initialize_testing_environment regenerates accounts, so lookups are dict reads.
+
+def normalize_address(addr):
+    addr = addr[2:] if addr.startswith("0x") else addr
+    return addr.rjust(16, "0")
+
+def strip_leading_zeros(addr):
+    return addr[:2] + addr[2:].lstrip("0")
+
+class FlowConfig:
+    def __init__(self, path):
+        self.path = path
+        self.stamp = None
+        self.lock = threading.Lock()
+
+    def refresh(self):
+        stat = os.stat(self.path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if stamp != self.stamp:
+            # Async helpers resolve addresses from worker threads
+            with self.lock:
+                if stamp != self.stamp:
+                    with open(self.path, "r") as f:
+                        self.load(json.load(f))
+                    self.stamp = stamp
+        return self
+
+    def load(self, flow_json):
+        # Addresses exactly as written in flow.json, which is what tests format into strings
+        self.account_addresses = {name: account['address'] for name, account in flow_json['accounts'].items()}
+        self.contract_deployers = {}
+        # only supporting test suite on emulator for now
+        for account, deployed in flow_json['deployments']['emulator'].items():
+            for contract in deployed:
+                name = contract['name'] if isinstance(contract, dict) else contract
+                self.contract_deployers[name] = self.account_addresses[account]
+        self.contract_names = set(flow_json['contracts'])
+        self.minimal_addresses = {}
+
+        # Normalized (16 hex chars, no 0x) addresses and keys used to sign and resolve imports
+        self.accounts = {}
+        for name, account in flow_json['accounts'].items():
+            key = account['key']
+            if isinstance(key, dict):
+                key = key['privateKey']
+            self.accounts[name] = {'address': normalize_address(account['address']), 'key': key}
+        self.contracts = {}
+        for name, contract in flow_json['contracts'].items():
+            if isinstance(contract, dict) and 'emulator' in contract.get('aliases', {}):
+                self.contracts[name] = normalize_address(contract['aliases']['emulator'])
+        for name, addr in self.contract_deployers.items():
+            self.contracts[name] = normalize_address(addr)
+
+    def address(self, entity):
+        self.refresh()
+        if entity in self.account_addresses:
+            return self.account_addresses[entity]
+        elif entity in self.contract_names:
+            return self.contract_deployers.get(entity)
+        else:
+            raise Exception("Entity not an account or contract")
+
+    def minimal_address(self, entity):
+        full_addr = self.address(entity)
+        if entity not in self.minimal_addresses:
+            self.minimal_addresses[entity] = strip_leading_zeros(full_addr)
+        return self.minimal_addresses[entity]
+
+_config = None
+
+def get_flow_config():
+    global _config
+    if _config is None:
+        _config = FlowConfig(current_emulator().config_path)
+    return _config.refresh()
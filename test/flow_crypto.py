@@ -0,0 +1,115 @@
+import hashlib
+import secrets
+
+# Minimal ECDSA over NIST P-256 with SHA3-256, the default signature and hash algorithms
+# for keys created by `flow init` and `flow keys generate`. Only what the test harness
+# needs to sign transactions in-process is implemented here.
+
+P = 0xffffffff00000001000000000000000000000000ffffffffffffffffffffffff
+A = P - 3
+B = 0x5ac635d8aa3a93e7b3ebbd55769886bc651d06b0cc53b0f63bce3c3e27d2604b
+N = 0xffffffff00000000ffffffffffffffffbce6faada7179e84f3b9cac2fc632551
+G = (
+    0x6b17d1f2e12c4247f8bce6e563a440f277037d812deb33a0f4a13945d898c296,
+    0x4fe342e2fe1a7f9b8ee7eb4a7c0f9e162bce33576b315ececbb6406837bf51f5
+)
+
+# Points are kept in Jacobian coordinates (X, Y, Z) while multiplying, None is the point at infinity
+def _to_jacobian(point):
+    return (point[0], point[1], 1)
+
+def _from_jacobian(point):
+    if point is None:
+        return None
+    x, y, z = point
+    z_inv = pow(z, -1, P)
+    z_inv2 = z_inv * z_inv % P
+    return (x * z_inv2 % P, y * z_inv2 * z_inv % P)
+
+def _double(point):
+    if point is None or point[1] == 0:
+        return None
+    x, y, z = point
+    yy = y * y % P
+    s = 4 * x * yy % P
+    zz = z * z % P
+    m = 3 * (x - zz) * (x + zz) % P
+    x3 = (m * m - 2 * s) % P
+    y3 = (m * (s - x3) - 8 * yy * yy) % P
+    z3 = 2 * y * z % P
+    return (x3, y3, z3)
+
+def _add(p1, p2):
+    if p1 is None:
+        return p2
+    if p2 is None:
+        return p1
+    x1, y1, z1 = p1
+    x2, y2, z2 = p2
+    z1z1 = z1 * z1 % P
+    z2z2 = z2 * z2 % P
+    u1 = x1 * z2z2 % P
+    u2 = x2 * z1z1 % P
+    s1 = y1 * z2 * z2z2 % P
+    s2 = y2 * z1 * z1z1 % P
+    if u1 == u2:
+        if s1 != s2:
+            return None
+        return _double(p1)
+    h = (u2 - u1) % P
+    r = (s2 - s1) % P
+    hh = h * h % P
+    hhh = h * hh % P
+    v = u1 * hh % P
+    x3 = (r * r - hhh - 2 * v) % P
+    y3 = (r * (v - x3) - s1 * hhh) % P
+    z3 = h * z1 * z2 % P
+    return (x3, y3, z3)
+
+def scalar_multiply(k, point=G):
+    result = None
+    addend = _to_jacobian(point)
+    while k:
+        if k & 1:
+            result = _add(result, addend)
+        addend = _double(addend)
+        k >>= 1
+    return _from_jacobian(result)
+
+def sign(private_key_hex, message):
+    d = int(private_key_hex, 16)
+    e = int.from_bytes(hashlib.sha3_256(message).digest(), "big")
+    while True:
+        k = secrets.randbelow(N - 1) + 1
+        r = scalar_multiply(k)[0] % N
+        if r == 0:
+            continue
+        s = pow(k, -1, N) * (e + r * d) % N
+        if s == 0:
+            continue
+        # Flow expects the raw 64 byte r || s encoding rather than DER
+        return r.to_bytes(32, "big") + s.to_bytes(32, "big")
+
+def verify(public_key_hex, message, signature):
+    qx = int(public_key_hex[:64], 16)
+    qy = int(public_key_hex[64:], 16)
+    r = int.from_bytes(signature[:32], "big")
+    s = int.from_bytes(signature[32:], "big")
+    if not (0 < r < N and 0 < s < N):
+        return False
+    e = int.from_bytes(hashlib.sha3_256(message).digest(), "big")
+    w = pow(s, -1, N)
+    point = _add(
+        _to_jacobian(scalar_multiply(e * w % N)),
+        _to_jacobian(scalar_multiply(r * w % N, (qx, qy)))
+    )
+    point = _from_jacobian(point)
+    return point is not None and point[0] % N == r
+
+def public_key_from_private(private_key_hex):
+    x, y = scalar_multiply(int(private_key_hex, 16))
+    return x.to_bytes(32, "big").hex() + y.to_bytes(32, "big").hex()
+
+def generate_key_pair():
+    private_key = format(secrets.randbelow(N - 1) + 1, "064x")
+    return private_key, public_key_from_private(private_key)
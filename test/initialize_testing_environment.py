@@ -4,43 +4,84 @@ import json
 from subprocess import check_output, run
 import time
 import sys
+import tempfile
 sys.path.append("./AsyncArtwork")
 
+from account_provisioning import provision_accounts
+from emulator_pool import BASE_FLOW_CONFIG, admin_request, current_emulator
+from event_indexer import get_indexer
+from flow_client import BACKEND
+from proposal_keys import reset_key_pools
+
 current_flow = {}
 
+# With FLOW_SNAPSHOTS=1 the emulator runs with snapshots enabled. The first main() in a
+# process deploys from scratch and snapshots that state, later calls restore the snapshot
+# through the emulator's admin API (FLOW_EMULATOR_ADMIN) instead of redeploying.
+USE_SNAPSHOTS = os.environ.get("FLOW_SNAPSHOTS") == "1"
+BASELINE_SNAPSHOT = "baseline"
+
+# Snapshots taken against the emulator started by this process
+snapshots = set()
+
 def init():
     global current_flow
     global existing_accounts
     global existing_contracts
     global existing_deployments
-    with open("flow.json", "r") as f:
+    emulator = current_emulator()
+    # Pool instances are generated from the shared flow.json, which they never modify
+    template_path = emulator.config_path if emulator.is_default else BASE_FLOW_CONFIG
+    with open(template_path, "r") as f:
         previous_flow_json = json.load(f)
         existing_accounts = previous_flow_json['accounts']
         existing_contracts = previous_flow_json['contracts']
         existing_deployments = previous_flow_json['deployments']
-    try:
-        check_output('rm -rf flow.json 2>&1 > /dev/null', shell=True)
-        check_output("flow init 2>&1 > /dev/null", shell=True)
-    except:
-        pass
-    with open("flow.json", "r") as f:
-        current_flow = json.load(f)
+    if emulator.is_default:
+        try:
+            check_output('rm -rf flow.json 2>&1 > /dev/null', shell=True)
+            check_output("flow init 2>&1 > /dev/null", shell=True)
+        except:
+            pass
+        with open("flow.json", "r") as f:
+            current_flow = json.load(f)
+    else:
+        # `flow init` always writes ./flow.json, so run it where it cannot clash with other workers
+        with tempfile.TemporaryDirectory() as tmpdir:
+            check_output("flow init 2>&1 > /dev/null", shell=True, cwd=tmpdir)
+            with open(os.path.join(tmpdir, "flow.json"), "r") as f:
+                current_flow = emulator.configure(json.load(f))
+        # The emulator and account creation below read the service account from this file
+        write_back()
 
 def run():
-    os.system("pkill -9 flow 2>&1 > /dev/null")
-    os.system('flow emulator -v --storage-limit=false --script-gas-limit=200000 2>&1 > emulator.log &')
-    time.sleep(1)
+    emulator = current_emulator()
+    emulator.stop()
+    snapshot_flag = " --snapshot" if USE_SNAPSHOTS else ""
+    started_at = time.monotonic()
+    emulator.start(f'flow emulator -v --storage-limit=false --script-gas-limit=200000{snapshot_flag}')
+    snapshots.clear()
+    # A fresh chain, nothing indexed or cached from the previous one applies
+    get_indexer().reset()
+    reset_key_pools()
+    emulator.wait_until_ready(started_at)
     
 def key_generate():
     return [X.split("\t")[1].strip() for X in check_output("flow keys generate", shell=True).decode().split("anyone!")[1].strip().split("\n")]
 
 def create_account():
     privkey, pubkey = key_generate()
-    return {'address': check_output(f"flow accounts create --key {pubkey} --signer emulator-account", shell=True).decode().split("Address")[1].split("\n")[0].strip(), 'key':privkey}
+    config_args = " ".join(current_emulator().cli_args)
+    return {'address': check_output(f"flow accounts create --key {pubkey} --signer emulator-account {config_args}", shell=True).decode().split("Address")[1].split("\n")[0].strip(), 'key':privkey}
 
 def regen_accounts():
     global current_flow
     global existing_accounts
+    if BACKEND == "client":
+        # Keys generated in-process, all accounts created in one batch of transactions
+        names = [account for account in existing_accounts if account != "emulator-account"]
+        current_flow['accounts'].update(provision_accounts(names))
+        return
     for account in existing_accounts:
         if account == "emulator-account":
             continue
@@ -58,14 +99,26 @@ def add_contracts():
 
 def write_back():
     global current_flow
-    with open("flow.json", "w") as f:
+    with open(current_emulator().config_path, "w") as f:
         f.write(json.dumps(current_flow, indent=4))
 
 def deploy_project():
-  os.system("flow project deploy")
+  config_args = " ".join(current_emulator().cli_args)
+  os.system(f"flow project deploy {config_args}")
 
 
-def main():
+def create_snapshot(name):
+    admin_request("POST", "/emulator/snapshots", {"name": name})
+    snapshots.add(name)
+
+def load_snapshot(name):
+    admin_request("PUT", f"/emulator/snapshots/{name}")
+    # Block heights go backwards, anything indexed past the snapshot no longer exists
+    get_indexer().reset()
+    # and so do sequence numbers
+    reset_key_pools()
+
+def deploy_from_scratch():
     init()
     run()
     regen_accounts()
@@ -74,6 +127,14 @@ def main():
     write_back()
     deploy_project()
 
+def main():
+    if USE_SNAPSHOTS and BASELINE_SNAPSHOT in snapshots:
+        load_snapshot(BASELINE_SNAPSHOT)
+        return
+    deploy_from_scratch()
+    if USE_SNAPSHOTS:
+        create_snapshot(BASELINE_SNAPSHOT)
+
 
 if __name__ == '__main__':
     main()
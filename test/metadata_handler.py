@@ -1,57 +1,111 @@
-import itertools
-def generate_possible_dictionary_strings(dict_tokens):
-  possible_dict_token_tuples = list(itertools.permutations(dict_tokens))
-  possible_dict_token_lists = [list(possible_dict_token_tuples[i]) for i in range(len(possible_dict_token_tuples))]
-  possible_dicts = []
-  for ordered_list in possible_dict_token_lists:
-    dict_str = "{"
-    for kvp in ordered_list:
-      dict_str += kvp + ", "
-    # Remove the last comma
-    dict_str = dict_str[:-2]
-    dict_str += "}"
-    possible_dicts.append(dict_str)
-  return possible_dicts
-
-
-## Limitation: max dict size is 10 keys
-def permute_string_dict(string_dict):
-  if (string_dict == "{}"):
-      return ["{}"]
-  tokens = []
-  for i in range(len(string_dict)-3):
-    if (string_dict[i] >= '0' and string_dict[i] <= '9' and string_dict[i+1] == ':' and string_dict[i+2] == ' '):
-      start = i
-      end = i+3
-      for j in range (i+3, len(string_dict)):
-        if (string_dict[j] == '}'):
-          end = j-1
-          break
-        elif (j < len(string_dict)-3 and string_dict[j] == ',' and string_dict[j+1] == ' ' and string_dict[j+2] >= '0' and string_dict[j+2] <= '9'):
-          end = j-1
-          break
-      tokens.append(string_dict[start:end+1])
-  return generate_possible_dictionary_strings(tokens)
-
-
-# Limitation: we don't support nested maps
-def get_metadata_possibilities(str):
-  metadata_possibilities = []
-  begin = 0
-  end  = 0
-  for i in range(len(str)):
-    if (str[i] == '{'):
-      begin = i
-    if (str[i] == '}'):
-      end = i
-      possible_string_dicts = permute_string_dict(str[begin:end+1])
-      for j in range(len(possible_string_dicts)):
-        metadata_possibilities.append(str[0:begin] + possible_string_dicts[j] + str[end+1:len(str)])
-  return metadata_possibilities
+## Cadence prints dictionaries in storage order, which is not stable across runs, so
+## expected metadata strings are compared structurally: both sides are parsed into a
+## canonical tree with dictionary entries sorted by key. Arrays and struct fields keep
+## their order. Nested dictionaries and any number of keys are supported.
+
+class CadenceParseError(Exception):
+  pass
+
+DELIMITERS = ",:)]}"
+
+class CadenceValueParser:
+  def __init__(self, text):
+    self.text = text
+    self.pos = 0
+
+  def parse(self):
+    value = self.parse_value()
+    self.skip_whitespace()
+    if self.pos != len(self.text):
+      raise CadenceParseError(f"Unexpected trailing input at {self.pos}")
+    return value
+
+  def skip_whitespace(self):
+    while self.pos < len(self.text) and self.text[self.pos] == ' ':
+      self.pos += 1
+
+  def expect(self, char):
+    self.skip_whitespace()
+    if self.pos >= len(self.text) or self.text[self.pos] != char:
+      raise CadenceParseError(f"Expected '{char}' at {self.pos}")
+    self.pos += 1
+
+  def peek(self):
+    self.skip_whitespace()
+    return self.text[self.pos] if self.pos < len(self.text) else ''
+
+  def parse_sequence(self, close, parse_item):
+    items = []
+    if self.peek() == close:
+      self.pos += 1
+      return items
+    while True:
+      items.append(parse_item())
+      if self.peek() == close:
+        self.pos += 1
+        return items
+      self.expect(',')
+
+  def parse_entry(self):
+    key = self.parse_value()
+    self.expect(':')
+    return (key, self.parse_value())
+
+  def parse_field(self):
+    name = self.parse_atom()
+    self.expect(':')
+    return (name, self.parse_value())
+
+  def parse_value(self):
+    char = self.peek()
+    if char == '"':
+      return ('str', self.parse_string())
+    if char == '[':
+      self.pos += 1
+      return ('array', tuple(self.parse_sequence(']', self.parse_value)))
+    if char == '{':
+      self.pos += 1
+      entries = self.parse_sequence('}', self.parse_entry)
+      return ('dict', tuple(sorted(entries, key=lambda entry: repr(entry[0]))))
+    atom = self.parse_atom()
+    if self.pos < len(self.text) and self.text[self.pos] == '(':
+      # Composite value e.g. A.01cf0e2f2f715450.AsyncArtwork.ControlLever(minValue: 1, ...)
+      self.pos += 1
+      return ('composite', atom, tuple(self.parse_sequence(')', self.parse_field)))
+    return ('literal', atom)
+
+  def parse_string(self):
+    start = self.pos
+    self.pos += 1
+    while self.pos < len(self.text):
+      if self.text[self.pos] == '\\':
+        self.pos += 2
+        continue
+      if self.text[self.pos] == '"':
+        self.pos += 1
+        return self.text[start:self.pos]
+      self.pos += 1
+    raise CadenceParseError(f"Unterminated string starting at {start}")
+
+  def parse_atom(self):
+    self.skip_whitespace()
+    start = self.pos
+    while self.pos < len(self.text) and self.text[self.pos] not in DELIMITERS and self.text[self.pos] not in ' ([{"':
+      self.pos += 1
+    if self.pos == start:
+      raise CadenceParseError(f"Expected a value at {start}")
+    return self.text[start:self.pos]
+
+def canonicalize(value_string):
+  return CadenceValueParser(value_string.strip()).parse()
 
 def result_equals_expected_metadata(result, expected_metadata):
-  equivallent_metadata_possibilities = get_metadata_possibilities(expected_metadata)
-  for p in equivallent_metadata_possibilities:
-    if result == p:
-      return True
-  return False
+  if not isinstance(result, str):
+    return False
+  if result == expected_metadata:
+    return True
+  try:
+    return canonicalize(result) == canonicalize(expected_metadata)
+  except CadenceParseError:
+    return False
+
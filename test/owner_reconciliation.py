@@ -0,0 +1,82 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from flow_config import get_flow_config
+from script_handler import ScriptError, fetch_nft_metadata_page, send_decoded_script_from_thread
+from transaction_handler import send_async_artwork_transaction
+from utils import address
+
+# Finds AsyncArtwork tokens whose recorded owner does not hold them. The token id space is
+# split into shards and getNFTsWithUncertainOwnerInRange runs per shard in parallel, so each
+# script execution stays bounded however large the collection grows (getNFTsWithUncertainOwner
+# checks everything in one execution).
+
+UNCERTAIN_OWNER_SCRIPT = "cadence/scripts/AsyncArtwork/getNFTsWithUncertainOwnerInRange.cdc"
+NFT_IDS_SCRIPT = "cadence/scripts/AsyncArtwork/getNFTIds.cdc"
+DEFAULT_SHARD_SIZE = 250
+DEFAULT_CONCURRENCY = 4
+
+def shards(max_id, shard_size, start_id=1):
+    return [(start, min(shard_size, max_id - start + 1)) for start in range(start_id, max_id + 1, shard_size)]
+
+# {recorded owner: [token ids]} for the tokens in [start_id, start_id + limit)
+def scan_shard(start_id, limit):
+    return send_decoded_script_from_thread(UNCERTAIN_OWNER_SCRIPT, [["UInt64", str(start_id)], ["UInt64", str(limit)]])
+
+# Yields (token id, recorded owner) for every token with an uncertain owner, shard by shard in id order
+def iter_uncertain_nfts(shard_size=DEFAULT_SHARD_SIZE, concurrency=DEFAULT_CONCURRENCY):
+    max_id = fetch_nft_metadata_page(1, 1).maxId
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for result in executor.map(lambda shard: scan_shard(*shard), shards(max_id, shard_size)):
+            yield from sorted((token_id, owner) for owner, ids in result.items() for token_id in ids)
+
+def find_uncertain_owners(shard_size=DEFAULT_SHARD_SIZE, concurrency=DEFAULT_CONCURRENCY):
+    uncertain = {}
+    for token_id, owner in iter_uncertain_nfts(shard_size, concurrency):
+        uncertain.setdefault(owner, []).append(token_id)
+    return uncertain
+
+class UnknownOwnerError(Exception):
+    pass
+
+# {flow.json account name: held token ids among token_ids} for the named accounts, queried
+# `concurrency` at a time. Accounts without a public AsyncArtwork collection hold nothing.
+def held_token_ids(names, token_ids, concurrency=DEFAULT_CONCURRENCY):
+    def held(name):
+        try:
+            return set(send_decoded_script_from_thread(NFT_IDS_SCRIPT, [["Address", address(name)]])) & token_ids
+        except ScriptError:
+            return set()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return {name: ids for name, ids in zip(names, executor.map(held, names)) if ids}
+
+# {flow.json account name: uncertain token ids it holds}. The recorded owners are queried first, as
+# tokens moved between them (e.g. swapped) are found without looking further. The other flow.json
+# accounts are only queried for the tokens still unaccounted for, e.g. a collection moved to an
+# account that owned nothing. Raises UnknownOwnerError if a recorded owner is not in flow.json.
+def find_holders(uncertain, concurrency=DEFAULT_CONCURRENCY):
+    names_by_address = {int(address(name), 16): name for name in get_flow_config().accounts}
+    unknown = [owner for owner in uncertain if owner not in names_by_address]
+    if unknown:
+        raise UnknownOwnerError("Recorded owners not in flow.json: " + ", ".join(hex(owner) for owner in unknown))
+
+    token_ids = {token_id for ids in uncertain.values() for token_id in ids}
+    owners = [names_by_address[owner] for owner in uncertain]
+    holders = held_token_ids(owners, token_ids, concurrency)
+    missing = token_ids.difference(*holders.values())
+    if missing:
+        others = [name for name in names_by_address.values() if name not in owners]
+        holders.update(held_token_ids(others, missing, concurrency))
+    return holders
+
+# Runs updateOwnerForOwnedNFTs from the flow.json accounts that actually hold uncertain tokens, which
+# records them as the owner. The recorded owner no longer holds them, so it cannot do this itself.
+# Tokens that no flow.json account holds under their id are left alone. Returns the uncertain tokens
+# by recorded owner and the addresses whose update succeeded.
+def reconcile_owners(shard_size=DEFAULT_SHARD_SIZE, concurrency=DEFAULT_CONCURRENCY, apply=True):
+    uncertain = find_uncertain_owners(shard_size, concurrency)
+    updated = []
+    if apply and uncertain:
+        for name in find_holders(uncertain, concurrency):
+            if send_async_artwork_transaction("updateOwnerForOwnedNFTs", signer=name):
+                updated.append(int(address(name), 16))
+    return uncertain, updated
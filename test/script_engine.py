@@ -0,0 +1,48 @@
+import os
+
+from flow_client import get_client, load_flow_config, resolve_imports
+
+# Executes scripts through the long-lived flow_client connection. Each script file is read
+# and has its `import X from "../../contracts/X.cdc"` lines resolved to emulator addresses
+# once; the resolved source is cached until the file's mtime changes.
+
+class ScriptEngine:
+    def __init__(self, client=None):
+        self.client = client or get_client()
+        self.cache = {}
+        self.contracts = None
+        self.hits = 0
+        self.misses = 0
+
+    def compile(self, scriptfile):
+        _, contracts = load_flow_config()
+        if contracts != self.contracts:
+            # Contract addresses moved (i.e. flow.json was regenerated), every resolved import is stale
+            self.cache.clear()
+            self.contracts = contracts
+
+        mtime = os.stat(scriptfile).st_mtime_ns
+        cached = self.cache.get(scriptfile)
+        if cached is not None and cached[0] == mtime:
+            self.hits += 1
+            return cached[1]
+
+        self.misses += 1
+        with open(scriptfile, "r") as f:
+            code = resolve_imports(f.read(), contracts)
+        self.cache[scriptfile] = (mtime, code)
+        return code
+
+    def execute(self, scriptfile, args, client=None):
+        return (client or self.client).execute_script(self.compile(scriptfile), args)
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self.cache)}
+
+_engine = None
+
+def get_engine():
+    global _engine
+    if _engine is None:
+        _engine = ScriptEngine()
+    return _engine
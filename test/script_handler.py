@@ -1,7 +1,14 @@
 import json
-from subprocess import check_output
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from subprocess import CalledProcessError, check_output
+from cadence_json import decode_value, format_value
+from emulator_pool import current_emulator
+from flow_client import BACKEND, FlowClient, FlowClientError
+from script_engine import get_engine
 
-def encode_args(args):
+def construct_arg_list(args):
     deet = []
     for arg in args:
         cur = {}
@@ -17,7 +24,13 @@ def encode_args(args):
             cur['type'] = arg[0]
             cur['value'] = arg[1]
         deet.append(cur)
-    return json.dumps(deet)
+    return deet
+
+def encode_args(args):
+    return json.dumps(construct_arg_list(args))
+
+class ScriptError(Exception):
+    pass
 
 def send_async_artwork_script(scriptname, args=None, show=False):
     scriptfile = f"cadence/scripts/AsyncArtwork/{scriptname}.cdc"
@@ -36,10 +49,13 @@ def send_script(scriptname, args=None, show=False):
     return send_script_driver(scriptfile, args, show)
 
 def send_script_driver(scriptfile, args, show):
+    if BACKEND == "client":
+        return send_script_client_driver(scriptfile, args, show) is not None
+
     if args:
-        deet = check_output(["flow", "scripts", "execute", scriptfile, "--args-json", encode_args(args)])
+        deet = check_output(["flow", "scripts", "execute", scriptfile, "--args-json", encode_args(args)] + current_emulator().cli_args)
     else:
-        deet = check_output(["flow", "scripts", "execute", scriptfile])
+        deet = check_output(["flow", "scripts", "execute", scriptfile] + current_emulator().cli_args)
 
     if show:
         print(deet.decode())
@@ -64,13 +80,122 @@ def send_script_and_return_result(scriptname, args=None, show=False):
     return send_script_and_return_result_driver(scriptfile, args, show)
 
 def send_script_and_return_result_driver(scriptfile, args, show):
+    if BACKEND == "client":
+        result = send_script_client_driver(scriptfile, args, show)
+        return False if result is None else format_value(result)
+
     if args:
-        deet = check_output(["flow", "scripts", "execute", scriptfile, "--args-json", encode_args(args)])
+        deet = check_output(["flow", "scripts", "execute", scriptfile, "--args-json", encode_args(args)] + current_emulator().cli_args)
     else:
-        deet = check_output(["flow", "scripts", "execute", scriptfile])
+        deet = check_output(["flow", "scripts", "execute", scriptfile] + current_emulator().cli_args)
 
     if show:
         print(deet.decode())
     if "Error" in deet.decode():
         return False
-    return deet.decode().strip().split("Result: ")[1]
\ No newline at end of file
+    return deet.decode().strip().split("Result: ")[1]
+
+def send_async_artwork_script_and_return_decoded_result(scriptname, args=None, show=False):
+    scriptfile = f"cadence/scripts/AsyncArtwork/{scriptname}.cdc"
+    return send_script_and_return_decoded_result_driver(scriptfile, args, show)
+
+def send_nft_auction_script_and_return_decoded_result(scriptname, args=None, show=False):
+    scriptfile = f"cadence/scripts/NFTAuction/{scriptname}.cdc"
+    return send_script_and_return_decoded_result_driver(scriptfile, args, show)
+
+def send_blueprints_script_and_return_decoded_result(scriptname, args=None, show=False):
+    scriptfile = f"cadence/scripts/Blueprints/{scriptname}.cdc"
+    return send_script_and_return_decoded_result_driver(scriptfile, args, show)
+
+def send_script_and_return_decoded_result(scriptname, args=None, show=False):
+    scriptfile = f"cadence/scripts/{scriptname}.cdc"
+    return send_script_and_return_decoded_result_driver(scriptfile, args, show)
+
+# Returns the script result decoded into Python values (see cadence_json.decode_value).
+# Raises ScriptError on failure, since False and None are legitimate script results here.
+def send_script_and_return_decoded_result_driver(scriptfile, args, show):
+    if BACKEND == "client":
+        result = send_script_client_driver(scriptfile, args, show)
+        if result is None:
+            raise ScriptError(f"Script {scriptfile} failed")
+        return decode_value(result)
+
+    command = ["flow", "scripts", "execute", scriptfile, "--output", "json"] + current_emulator().cli_args
+    if args:
+        command += ["--args-json", encode_args(args)]
+    try:
+        deet = check_output(command).decode()
+    except CalledProcessError as e:
+        raise ScriptError(f"Script {scriptfile} failed") from e
+
+    if show:
+        print(deet)
+    try:
+        result = json.loads(deet)
+    except ValueError as e:
+        raise ScriptError(f"Script {scriptfile} failed: {deet}") from e
+    return decode_value(result)
+
+# Returns the JSON-Cadence result, or None if the script failed
+def send_script_client_driver(scriptfile, args, show):
+    try:
+        result = get_engine().execute(scriptfile, construct_arg_list(args) if args else [])
+    except FlowClientError as e:
+        if show:
+            print(e)
+        return None
+
+    if show:
+        print(format_value(result))
+    return result
+
+def script_cache_stats():
+    return get_engine().stats()
+
+NFT_METADATA_PAGE_SCRIPT = "cadence/scripts/AsyncArtwork/getNFTMetadataPage.cdc"
+DEFAULT_PAGE_SIZE = 100
+DEFAULT_CRAWL_CONCURRENCY = 4
+
+_local = threading.local()
+
+def _thread_client():
+    # The shared client connection is not thread safe, each crawler thread keeps its own
+    if not hasattr(_local, "client"):
+        _local.client = FlowClient()
+    return _local.client
+
+# Like send_script_and_return_decoded_result_driver, but safe to call from worker threads
+def send_decoded_script_from_thread(scriptfile, args):
+    if BACKEND != "client":
+        return send_script_and_return_decoded_result_driver(scriptfile, args, False)
+    try:
+        return decode_value(get_engine().execute(scriptfile, construct_arg_list(args), _thread_client()))
+    except FlowClientError as e:
+        raise ScriptError(f"Script {scriptfile} failed") from e
+
+# Decoded AsyncArtwork.NFTMetadataPage (items, nextId, maxId)
+def fetch_nft_metadata_page(start_id, limit):
+    return send_decoded_script_from_thread(NFT_METADATA_PAGE_SCRIPT, [["UInt64", str(start_id)], ["UInt64", str(limit)]])
+
+# Streams the metadata of every AsyncArtwork token in id order. The first page gives the highest
+# id handed out, the remaining id ranges are then fetched `concurrency` at a time while earlier
+# pages are being consumed.
+def crawl_nft_metadata(page_size=DEFAULT_PAGE_SIZE, concurrency=DEFAULT_CRAWL_CONCURRENCY, start_id=1):
+    first = fetch_nft_metadata_page(start_id, page_size)
+    yield from first.items
+    if first.nextId is None:
+        return
+
+    starts = iter(range(first.nextId, first.maxId + 1, page_size))
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        pending = deque()
+        for start in starts:
+            pending.append(executor.submit(fetch_nft_metadata_page, start, page_size))
+            if len(pending) == concurrency:
+                break
+        while pending:
+            page = pending.popleft().result()
+            following = next(starts, None)
+            if following is not None:
+                pending.append(executor.submit(fetch_nft_metadata_page, following, page_size))
+            yield from page.items
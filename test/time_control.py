@@ -0,0 +1,43 @@
+import time
+from decimal import Decimal
+
+from emulator_pool import EmulatorAdminError, admin_request
+from script_handler import send_nft_auction_script_and_return_decoded_result, send_script_and_return_decoded_result
+from transaction_handler import send_transaction
+
+# Moves the emulator's block time forward for tests that wait on a deadline, instead of
+# sealing ~120 simulateTimeDelay transactions. Emulator block timestamps come from its
+# wall clock, so this waits exactly as long as the deadline needs and then commits a single
+# empty block through the admin API so that the next transaction sees the new time.
+
+# NFTAuction.settleAuction requires getCurrentBlock().timestamp > auctionEnd + 10.0
+SETTLEMENT_GRACE_PERIOD = Decimal("10.0")
+CLOCK_MARGIN = 0.05
+
+def current_block_timestamp():
+    return send_script_and_return_decoded_result("getCurrentBlockTimestamp")
+
+def commit_block():
+    try:
+        admin_request("POST", "/emulator/newBlock")
+    except (EmulatorAdminError, OSError):
+        # Emulators without the admin endpoint still seal a block per transaction
+        assert send_transaction("simulateTimeDelay")
+
+def advance_time_past(target_timestamp):
+    target_timestamp = Decimal(target_timestamp)
+    while True:
+        commit_block()
+        now = current_block_timestamp()
+        if now > target_timestamp:
+            return now
+        time.sleep(float(target_timestamp - now) + CLOCK_MARGIN)
+
+def advance_time(seconds):
+    return advance_time_past(current_block_timestamp() + Decimal(seconds))
+
+# Advance until the auction for (nftTypeIdentifier, tokenId) can be settled
+def advance_past_auction_end(nft_type_identifier, token_id):
+    auction = send_nft_auction_script_and_return_decoded_result("getAuction", args=[["String", nft_type_identifier], ["UInt64", token_id]])
+    assert auction is not None and auction.auctionEnd is not None, "Auction has no end time"
+    return advance_time_past(auction.auctionEnd + SETTLEMENT_GRACE_PERIOD)
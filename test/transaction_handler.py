@@ -1,5 +1,10 @@
 import json
+import time
 from subprocess import check_output
+from benchmark import record_transaction
+from emulator_pool import current_emulator
+from flow_client import BACKEND, DEFAULT_GAS_LIMIT, get_client, send_transaction_file
+from transaction_result import from_access_api, from_cli_output
 
 def construct_arg_list(args):
     deet = []
@@ -27,30 +32,85 @@ def encode_args(args):
     res = json.dumps(deet)
     return res
 
-def send_nft_auction_transaction(txname, args=None, signer='emulator-account', show=False):
+def send_nft_auction_transaction(txname, args=None, signer='emulator-account', show=False, gas_limit=None):
     txfile = f"cadence/transactions/NFTAuction/{txname}.cdc"
-    return send_transaction_driver(txfile, args, signer, show)
+    return send_transaction_driver(txfile, args, signer, show, gas_limit)
 
-def send_async_artwork_transaction(txname, args=None, signer='emulator-account', show=False):
+def send_async_artwork_transaction(txname, args=None, signer='emulator-account', show=False, gas_limit=None, authorizers=()):
     txfile = f"cadence/transactions/AsyncArtwork/{txname}.cdc"
-    return send_transaction_driver(txfile, args, signer, show)
+    return send_transaction_driver(txfile, args, signer, show, gas_limit, authorizers)
 
-def send_blueprints_transaction(txname, args=None, signer='emulator-account', show=False):
+def send_blueprints_transaction(txname, args=None, signer='emulator-account', show=False, gas_limit=None):
     txfile = f"cadence/transactions/Blueprints/{txname}.cdc"
-    return send_transaction_driver(txfile, args, signer, show)
+    return send_transaction_driver(txfile, args, signer, show, gas_limit)
 
-def send_transaction(txname, args=None, signer='emulator-account', show=False):
+def send_transaction(txname, args=None, signer='emulator-account', show=False, gas_limit=None):
     txfile = f"cadence/transactions/{txname}.cdc"
-    return send_transaction_driver(txfile, args, signer, show)
+    return send_transaction_driver(txfile, args, signer, show, gas_limit)
 
-def send_transaction_driver(txfilepath, args, signer,show):
+# authorizers are further flow.json accounts that authorize the transaction after the signer, in prepare argument order
+def transaction_command(txfilepath, args, signer, gas_limit=None, authorizers=()):
+    gas_args = ['--gas-limit', str(gas_limit)] if gas_limit else []
+    signer_args = ['--signer', signer]
+    if authorizers:
+        signer_args = ['--proposer', signer, '--payer', signer, '--authorizer', ",".join([signer] + list(authorizers))]
     if args:
-        deet = check_output(["flow", "transactions", "send", "--args-json", encode_args(args), '--signer', signer, txfilepath])
+        return ["flow", "transactions", "send", "--args-json", encode_args(args)] + signer_args + ['--output', 'json'] + gas_args + [txfilepath] + current_emulator().cli_args
+    return ["flow", "transactions", "send"] + signer_args + ['--output', 'json'] + gas_args + [txfilepath] + current_emulator().cli_args
+
+# Every send helper returns a TransactionResult, which is truthy when the transaction succeeded
+def send_transaction_driver(txfilepath, args, signer, show, gas_limit=None, authorizers=()):
+    started_at = time.perf_counter()
+    if BACKEND == "client":
+        result = send_transaction_client_driver(txfilepath, args, signer, gas_limit, authorizers)
     else:
-        deet = check_output(["flow", "transactions", "send", '-l', 'debug', '--signer', signer, txfilepath])
+        result = from_cli_output(check_output(transaction_command(txfilepath, args, signer, gas_limit, authorizers)).decode())
+    record_transaction(txfilepath, result, time.perf_counter() - started_at)
 
     if show:
-        print(deet.decode())
-    if "Transaction Error" in deet.decode():
-        return False
-    return True
\ No newline at end of file
+        print(result)
+    return result
+
+def transaction_result_from_access_api(result, client=None):
+    client = client or get_client()
+    block = client.get_block_header(result['block_id']) if result.get('block_id') else None
+    return from_access_api(result['id'], result, block)
+
+def send_transaction_client_driver(txfilepath, args, signer, gas_limit=None, authorizers=()):
+    return transaction_result_from_access_api(send_transaction_file(txfilepath, construct_arg_list(args) if args else [], signer, gas_limit, authorizers))
+
+# Fraction of the gas limit a claimNFTsWithLimit chunk is sized to use
+NFT_CLAIMS_COMPUTATION_TARGET = 0.8
+
+def is_computation_limit_exceeded(message):
+    message = (message or "").lower()
+    return "computation" in message and "limit" in message
+
+# Claims every NFT of a type owed to signer through claimNFTsWithLimit, one chunk per transaction.
+# Each chunk is sized from the computation the previous one used per NFT, a chunk that runs out of
+# computation is retried at half its size. Without computation figures (CLI backend) the chunk
+# size doubles after every success. Returns the number of NFTs claimed.
+def drain_nft_claims(nft_type_identifier, signer, limit=10, max_limit=500, gas_limit=None, show=False):
+    budget = (gas_limit or DEFAULT_GAS_LIMIT) * NFT_CLAIMS_COMPUTATION_TARGET
+    claimed = 0
+    while True:
+        args = [["String", nft_type_identifier], ["UInt64", str(limit)]]
+        result = send_nft_auction_transaction("claimNFTsWithLimit", args=args, signer=signer, show=show, gas_limit=gas_limit)
+        if not result:
+            if is_computation_limit_exceeded(result.error_message) and limit > 1:
+                limit = max(1, limit // 2)
+                continue
+            if "does not have any NFTs to claim" in result.error_message:
+                return claimed
+            raise Exception(f"Claiming NFTs failed: {result.error_message}")
+
+        event = next(e for e in result.events if e.type.endswith(".NFTAuction.NFTsClaimed"))
+        claimed += event.get("count")
+        if event.get("remaining") == 0:
+            return claimed
+        if result.computation_used:
+            per_nft = result.computation_used / max(event.get("count"), 1)
+            limit = int(budget / per_nft)
+        else:
+            limit = limit * 2
+        limit = max(1, min(max_limit, limit))
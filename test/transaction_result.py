@@ -0,0 +1,99 @@
+import json
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from cadence_json import decode_value
+from event_indexer import EventRecord, decode_event, filter_events
+
+# Outcome of a sent transaction. Truthy exactly when the transaction succeeded, so existing
+# `assert send_transaction(...)` / `assert not send_transaction(...)` checks keep working,
+# while tests can inspect the events emitted by that transaction without querying blocks:
+#
+#   result = send_nft_auction_transaction("makeBid", args=txn_args, signer=signer)
+#   assert result.has_event(f'A.{address("NFTAuction")[2:]}.NFTAuction.BidMade')
+
+# Access API status codes, 1 is any execution error
+STATUS_CODE_SUCCESS = 0
+STATUS_CODE_ERROR = 1
+
+@dataclass
+class TransactionResult:
+    id: str
+    status: str
+    status_code: int
+    error_message: str = ""
+    block_id: Optional[str] = None
+    block_height: Optional[int] = None
+    computation_used: Optional[int] = None
+    events: List[EventRecord] = field(default_factory=list)
+
+    @property
+    def succeeded(self):
+        return not self.error_message and self.status_code == STATUS_CODE_SUCCESS and self.status != "Expired"
+
+    def __bool__(self):
+        return self.succeeded
+
+    def events_of(self, event_type, **fields):
+        return filter_events([e for e in self.events if e.type == event_type], **fields)
+
+    def has_event(self, event_type, num_expected_occurences=1, **fields):
+        return len(self.events_of(event_type, **fields)) >= num_expected_occurences
+
+    def __str__(self):
+        lines = [f"Transaction {self.id}: {self.status}" + (f" in block {self.block_height}" if self.block_height is not None else "")]
+        if self.computation_used is not None:
+            lines.append(f"Computation used: {self.computation_used}")
+        if self.error_message:
+            lines.append(f"Error: {self.error_message}")
+        lines.extend(f"Event {e.event_index}: {e.type} {e.fields}" for e in self.events)
+        return "\n".join(lines)
+
+def _optional_int(value):
+    return None if value in (None, "") else int(value)
+
+# From a /v1/transaction_results response, `block` being the header of the block it executed in
+def from_access_api(tx_id, result, block=None):
+    block_id = result.get('block_id') or None
+    block_height = _optional_int(block['height']) if block else None
+    return TransactionResult(
+        id=tx_id,
+        status=result['status'],
+        status_code=int(result.get('status_code') or 0),
+        error_message=result.get('error_message') or "",
+        block_id=block_id,
+        block_height=block_height,
+        computation_used=_optional_int(result.get('computation_used')),
+        events=[decode_event(event, block_height, block_id) for event in result.get('events', [])]
+    )
+
+# From `flow transactions send --output json`. The CLI reports status as e.g. "SEALED" and
+# execution failures in "error"; events carry their JSON-Cadence payload in "values"
+def from_cli_output(output):
+    # Anything the CLI prints before the JSON document (update notices etc.) is skipped
+    result = json.loads(output[output.index("{"):])
+    error_message = result.get('error') or ""
+    block_id = result.get('block_id') or None
+    block_height = _optional_int(result.get('block_height'))
+    events = [
+        EventRecord(
+            type=event['type'],
+            block_height=block_height,
+            block_id=block_id,
+            transaction_id=event.get('tx_id', result.get('id')),
+            transaction_index=0,
+            event_index=int(event.get('index', i)),
+            fields=decode_value(event['values'])
+        )
+        for i, event in enumerate(result.get('events') or [])
+    ]
+    return TransactionResult(
+        id=result.get('id'),
+        status=str(result.get('status', "")).capitalize(),
+        status_code=STATUS_CODE_ERROR if error_message else STATUS_CODE_SUCCESS,
+        error_message=error_message,
+        block_id=block_id,
+        block_height=block_height,
+        computation_used=_optional_int(result.get('computation_used')),
+        events=events
+    )
@@ -1,29 +1,15 @@
-import json
+from flow_config import get_flow_config, strip_leading_zeros
 from transaction_handler import send_transaction
 
 def remove_leading_zeros(addr):
-    while (addr[2] == '0' and 2 in range(len(addr))):
-        addr = addr[:2] + addr[2+1:]
-    return addr
+    return strip_leading_zeros(addr)
 
 def minimal_address(entity):
-    full_addr = address(entity)
-    return remove_leading_zeros(full_addr)
+    return get_flow_config().minimal_address(entity)
 
+# flow.json is parsed once and re-read only when it changes on disk
 def address(entity):
-    with open("flow.json", "r") as f:
-        flow_json = json.load(f)
-        if entity in flow_json['accounts']:
-            return flow_json['accounts'][entity]['address']
-        elif entity in flow_json['contracts']:
-            # only supporting test suite on emulator for now
-            emulator = flow_json['deployments']['emulator']
-            for account in emulator:
-                for contract in emulator[account]:
-                    if entity == contract or ("name" in contract and entity == contract["name"]):
-                        return flow_json['accounts'][account]["address"]
-        else:
-            raise Exception("Entity not an account or contract")
+    return get_flow_config().address(entity)
 
 
 def transfer_flow_token(recipient, amount, signer):